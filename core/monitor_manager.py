@@ -1,19 +1,46 @@
 """
 Çoklu monitör wallpaper yönetimi
 """
-import json
+from __future__ import annotations
+
 import logging
-from dataclasses import dataclass, asdict
+import os
+import tempfile
+import threading
+from functools import partial
+from itertools import compress, count
+from operator import and_
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from enum import Enum
 
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QCoreApplication, QObject, Signal, QTimer, QRunnable, QThreadPool
 
 from utils.monitor_utils import MonitorInfo, get_detailed_monitor_info
 
 logger = logging.getLogger(__name__)
 
+# orjson varsa C tabanlı serializer kullan, yoksa stdlib json'a düş
+# (json yalnızca ilk ayar okuma/yazmasında import edilir)
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        import json
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data: bytes):
+        import json
+        return json.loads(data)
+
 
 class SlideshowMode(Enum):
     """Slideshow çalma modları."""
@@ -22,6 +49,10 @@ class SlideshowMode(Enum):
     MIXED = "mixed"               # Karışık mod (bazı senkron, bazı bağımsız)
 
 
+# Yükleme sırasında EnumMeta.__call__ yerine doğrudan dict araması
+_MODE_BY_VALUE = {m.value: m for m in SlideshowMode}
+
+
 @dataclass
 class SlideshowConfig:
     """Slideshow konfigürasyon ayarları."""
@@ -36,6 +67,16 @@ class SlideshowConfig:
             self.monitor_timers = {}
         if self.synchronized_monitors is None:
             self.synchronized_monitors = []
+    
+    def _as_json_dict(self) -> Dict:
+        """JSON'a yazılacak dict'i kopyalamadan döner (asdict yerine)."""
+        return {
+            "mode": self.mode.value,
+            "timer_interval": self.timer_interval,
+            "is_active": self.is_active,
+            "monitor_timers": self.monitor_timers,
+            "synchronized_monitors": self.synchronized_monitors,
+        }
 
 
 @dataclass
@@ -51,6 +92,54 @@ class MonitorSettings:
     def __post_init__(self):
         if self.playlist is None:
             self.playlist = []
+    
+    def _as_json_dict(self) -> Dict:
+        """JSON'a yazılacak dict'i kopyalamadan döner (asdict yerine)."""
+        return {
+            "monitor_name": self.monitor_name,
+            "current_wallpaper": self.current_wallpaper,
+            "wallpaper_scaling": self.wallpaper_scaling,
+            "slideshow_enabled": self.slideshow_enabled,
+            "playlist": self.playlist,
+            "custom_timer": self.custom_timer,
+        }
+
+
+def _atomic_write(target: Path, payload: bytes) -> None:
+    """
+    İçeriği aynı dizinde benzersiz bir geçici dosyaya yazıp atomik olarak yer değiştirir.
+    
+    Her yazım kendi geçici dosyasını kullandığı için eşzamanlı yazımlar birbirini bozmaz.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class _SaveRunnable(QRunnable):
+    """Hazır JSON içeriğini arka planda atomik olarak diske yazar."""
+    
+    def __init__(self, writer: Callable[[bytes, int], None], payload: bytes, seq: int):
+        super().__init__()
+        self.writer = writer
+        self.payload = payload
+        self.seq = seq
+    
+    def run(self) -> None:
+        try:
+            self.writer(self.payload, self.seq)
+            logger.debug("Monitör ayarları arka planda kaydedildi")
+        except Exception as e:
+            logger.error(f"Monitör ayarları arka planda kaydedilirken hata: {e}")
 
 
 class MonitorManager(QObject):
@@ -67,6 +156,9 @@ class MonitorManager(QObject):
     slideshow_state_changed = Signal(bool)  # is_active
     monitor_configuration_changed = Signal()
     
+    # Ayar dosyası varsayılan olarak kompakt yazılır; hata ayıklama için True yapılabilir
+    PRETTY_JSON: bool = False
+    
     def __init__(self):
         super().__init__()
         
@@ -74,6 +166,21 @@ class MonitorManager(QObject):
         self.monitors: Dict[str, MonitorInfo] = {}
         self.monitor_settings: Dict[str, MonitorSettings] = {}
         
+        # Aktif monitör önbelleği (refresh_monitors'ta geçersiz kılınır)
+        self._active_monitors_cache: Optional[Tuple[MonitorInfo, ...]] = None
+        self._active_names_cache: Optional[List[str]] = None
+        
+        # Sıcak yollardaki predicate taramaları için paralel diziler (SoA)
+        self._names: List[str] = []
+        self._is_active: List[bool] = []
+        self._is_primary: List[bool] = []
+        
+        # Son refresh_monitors çağrısındaki monitör imzası (değişiklik yoksa erken çıkış)
+        self._last_monitor_sig: Optional[Tuple] = None
+        
+        # monitor_configuration_changed sinyali event loop'ta tek emit'e birleştirilir
+        self._config_dirty = False
+        
         # Slideshow ayarları
         self.slideshow_config = SlideshowConfig(
             mode=SlideshowMode.SYNCHRONIZED,
@@ -84,11 +191,37 @@ class MonitorManager(QObject):
         self.slideshow_timer = QTimer()
         self.slideshow_timer.timeout.connect(self._on_slideshow_timeout)
         
-        self.monitor_timers: Dict[str, QTimer] = {}
+        # Slideshow modu -> başlatıcı
+        self._mode_dispatch: Dict[SlideshowMode, Callable[[], None]] = {
+            SlideshowMode.SYNCHRONIZED: self._start_synchronized_slideshow,
+            SlideshowMode.INDEPENDENT: self._start_independent_slideshow,
+            SlideshowMode.MIXED: self._start_mixed_slideshow,
+        }
+        
+        # Aynı aralığa sahip monitörler tek bir timer'ı paylaşır (interval -> timer/monitörler)
+        self._bucket_timers: Dict[int, QTimer] = {}
+        self._timer_buckets: Dict[int, List[str]] = {}
+        # Durdurulmuş, yeniden kullanılmayı bekleyen timer'lar (hot-plug'da QObject churn'ü önler)
+        self._timer_pool: List[QTimer] = []
         
         # Ayarlar dosyası
         self.settings_file = Path.home() / ".config" / "wallpaper_engine" / "monitor_settings.json"
         
+        # Ardışık kayıt isteklerini tek yazıma indiren debounce timer'ı
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
+        # Yazımlar sıra numarasıyla serileştirilir; eski içerik yenisinin üzerine yazılmaz
+        self._write_lock = threading.Lock()
+        self._save_seq = count(1)
+        self._written_seq = 0
+        
+        # Çıkışta bekleyen debounce'lu kaydı kaybetme
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_save)
+        
         # Wallpaper engine referansı
         self.wallpaper_engine = None
         
@@ -108,9 +241,19 @@ class MonitorManager(QObject):
         try:
             new_monitors = get_detailed_monitor_info()
             
-            # Monitör değişikliklerini kontrol et
-            old_monitor_names = set(self.monitors.keys())
-            new_monitor_names = set(m.name for m in new_monitors)
+            # Hiçbir şey değişmediyse sözlüğü yeniden kurmadan çık
+            sig = tuple(
+                (m.name, m.is_active, m.is_primary, m.resolution, m.position,
+                 m.refresh_rate, m.connection_type)
+                for m in new_monitors
+            )
+            if sig == self._last_monitor_sig:
+                return
+            
+            # Yeni sözlüğü tek geçişte oluştur, değişiklikleri key view'ları üzerinden bul
+            new_by_name = {m.name: m for m in new_monitors}
+            new_monitor_names = new_by_name.keys()
+            old_monitor_names = self.monitors.keys()
             
             # Yeni eklenen monitörler
             added_monitors = new_monitor_names - old_monitor_names
@@ -119,21 +262,28 @@ class MonitorManager(QObject):
             
             if added_monitors or removed_monitors:
                 logger.info(f"Monitör değişikliği: +{added_monitors}, -{removed_monitors}")
-                self.monitor_configuration_changed.emit()
+                self._schedule_config_changed()
             
             # Monitör bilgilerini güncelle
-            self.monitors = {m.name: m for m in new_monitors}
+            self.monitors = new_by_name
             
             # Yeni monitörler için ayarlar oluştur
             for monitor_name in added_monitors:
                 if monitor_name not in self.monitor_settings:
                     self.monitor_settings[monitor_name] = MonitorSettings(monitor_name=monitor_name)
             
-            # Kaldırılan monitörler için timer'ları temizle
+            # Kaldırılan monitörleri timer gruplarından çıkar
             for monitor_name in removed_monitors:
-                if monitor_name in self.monitor_timers:
-                    self.monitor_timers[monitor_name].stop()
-                    del self.monitor_timers[monitor_name]
+                for interval, names in list(self._timer_buckets.items()):
+                    if monitor_name in names:
+                        names.remove(monitor_name)
+                        if not names:
+                            del self._timer_buckets[interval]
+                            self._release_bucket_timer(interval)
+            
+            self._rebuild_monitor_arrays()
+            self._invalidate_active_cache()
+            self._last_monitor_sig = sig
             
             logger.debug(f"Monitör bilgileri güncellendi: {len(self.monitors)} aktif monitör")
             
@@ -152,28 +302,31 @@ class MonitorManager(QObject):
             bool: İşlem başarılı ise True
         """
         try:
-            if monitor_name not in self.monitors:
+            monitor = self.monitors.get(monitor_name)
+            if monitor is None:
                 logger.warning(f"Bilinmeyen monitör: {monitor_name}")
                 return False
             
-            if not self.monitors[monitor_name].is_active:
+            if not monitor.is_active:
                 logger.warning(f"Monitör aktif değil: {monitor_name}")
                 return False
             
             # Monitör ayarlarını güncelle
-            if monitor_name not in self.monitor_settings:
-                self.monitor_settings[monitor_name] = MonitorSettings(monitor_name=monitor_name)
+            settings = self.monitor_settings.get(monitor_name)
+            if settings is None:
+                settings = self.monitor_settings[monitor_name] = MonitorSettings(monitor_name=monitor_name)
             
-            self.monitor_settings[monitor_name].current_wallpaper = wallpaper_id
+            settings.current_wallpaper = wallpaper_id
             
             # MonitorInfo'yu da güncelle
-            self.monitors[monitor_name].current_wallpaper = wallpaper_id
+            monitor.current_wallpaper = wallpaper_id
             
             # Wallpaper'ı uygula (WallpaperEngine üzerinden)
             success = self._apply_wallpaper_to_monitor(monitor_name, wallpaper_id)
             
             if success:
                 self.monitor_wallpaper_changed.emit(monitor_name, wallpaper_id)
+                self.request_save()
                 logger.info(f"Wallpaper atandı: {monitor_name} -> {wallpaper_id}")
                 return True
             else:
@@ -203,7 +356,7 @@ class MonitorManager(QObject):
                 return True
             
             # Aktif monitörleri kontrol et
-            active_monitors = [name for name, monitor in self.monitors.items() if monitor.is_active]
+            active_monitors = self._get_active_names()
             if not active_monitors:
                 logger.warning("Aktif monitör bulunamadı")
                 return False
@@ -211,14 +364,10 @@ class MonitorManager(QObject):
             self.slideshow_config.is_active = True
             
             # Slideshow moduna göre timer'ları başlat
-            if self.slideshow_config.mode == SlideshowMode.SYNCHRONIZED:
-                self._start_synchronized_slideshow()
-            elif self.slideshow_config.mode == SlideshowMode.INDEPENDENT:
-                self._start_independent_slideshow()
-            elif self.slideshow_config.mode == SlideshowMode.MIXED:
-                self._start_mixed_slideshow()
+            self._mode_dispatch[self.slideshow_config.mode]()
             
             self.slideshow_state_changed.emit(True)
+            self.request_save()
             logger.info(f"Slideshow başlatıldı: {self.slideshow_config.mode.value}")
             return True
             
@@ -240,11 +389,12 @@ class MonitorManager(QObject):
             
             # Tüm timer'ları durdur
             self.slideshow_timer.stop()
-            for timer in self.monitor_timers.values():
+            for timer in self._bucket_timers.values():
                 timer.stop()
             
             self.slideshow_config.is_active = False
             self.slideshow_state_changed.emit(False)
+            self.request_save()
             
             logger.info("Slideshow durduruldu")
             return True
@@ -261,27 +411,26 @@ class MonitorManager(QObject):
             bool: İşlem başarılı ise True
         """
         try:
-            active_monitors = [name for name, monitor in self.monitors.items() if monitor.is_active]
+            active_monitors = self._get_active_names()
             if len(active_monitors) < 2:
                 logger.warning("Senkronize edilecek yeterli monitör yok")
                 return False
             
             # Primary monitördeki wallpaper'ı al
-            primary_monitor = None
-            for monitor in self.monitors.values():
-                if monitor.is_primary and monitor.is_active:
-                    primary_monitor = monitor
-                    break
+            primary_name = next(compress(self._names, map(and_, self._is_primary, self._is_active)), None)
+            primary_monitor = self.monitors.get(primary_name) if primary_name is not None else None
+            wallpaper_id = primary_monitor.current_wallpaper if primary_monitor else None
             
-            if not primary_monitor or not primary_monitor.current_wallpaper:
+            if not wallpaper_id:
                 logger.warning("Primary monitör wallpaper'ı bulunamadı")
                 return False
             
             # Diğer monitörlere aynı wallpaper'ı uygula
             success_count = 0
+            assign_wallpaper = self.assign_wallpaper
             for monitor_name in active_monitors:
-                if monitor_name != primary_monitor.name:
-                    if self.assign_wallpaper(monitor_name, primary_monitor.current_wallpaper):
+                if monitor_name != primary_name:
+                    if assign_wallpaper(monitor_name, wallpaper_id):
                         success_count += 1
             
             logger.info(f"Slideshow senkronizasyonu: {success_count}/{len(active_monitors)-1} başarılı")
@@ -303,14 +452,19 @@ class MonitorManager(QObject):
         """
         return self.monitors.get(monitor_name)
     
-    def get_active_monitors(self) -> List[MonitorInfo]:
+    def get_active_monitors(self) -> Tuple[MonitorInfo, ...]:
         """
         Aktif monitörlerin listesini döner.
         
         Returns:
-            List[MonitorInfo]: Aktif monitörler
+            Tuple[MonitorInfo, ...]: Aktif monitörler (değiştirilemez)
         """
-        return [monitor for monitor in self.monitors.values() if monitor.is_active]
+        if self._active_monitors_cache is None:
+            monitors = self.monitors
+            self._active_monitors_cache = tuple(
+                monitors[name] for name in compress(self._names, self._is_active)
+            )
+        return self._active_monitors_cache
     
     def get_monitor_settings(self, monitor_name: str) -> Optional[MonitorSettings]:
         """
@@ -332,21 +486,11 @@ class MonitorManager(QObject):
             bool: İşlem başarılı ise True
         """
         try:
-            # Dizini oluştur
-            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Ayarları serialize et
-            settings_data = {
-                "slideshow_config": asdict(self.slideshow_config),
-                "monitor_settings": {
-                    name: asdict(settings) for name, settings in self.monitor_settings.items()
-                }
-            }
+            # Ayarları tek seferde serialize et
+            data = self._serialize_settings()
             
-            # JSON'a yaz
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings_data, f, indent=2, ensure_ascii=False)
-                f.flush()
+            # Geçici dosyaya tek yazım, ardından atomik olarak yer değiştir
+            self._write_settings_file(data, next(self._save_seq))
             
             logger.info("Monitör ayarları kaydedildi")
             return True
@@ -355,6 +499,59 @@ class MonitorManager(QObject):
             logger.error(f"Monitör ayarları kaydedilirken hata: {e}")
             return False
     
+    def request_save(self) -> None:
+        """
+        Debounce'lu kayıt ister; kısa sürede gelen istekler tek yazıma indirilir.
+        """
+        self._save_timer.start()
+    
+    def _flush_save(self) -> None:
+        """Bekleyen kaydı serialize eder ve yazımı thread pool'a devreder."""
+        try:
+            # Listeler paylaşıldığı için serialize işlemi Qt thread'inde yapılır
+            payload = self._serialize_settings()
+            QThreadPool.globalInstance().start(
+                _SaveRunnable(self._write_settings_file, payload, next(self._save_seq))
+            )
+        except Exception as e:
+            logger.error(f"Monitör ayarları kaydedilirken hata: {e}")
+    
+    def flush_pending_save(self) -> None:
+        """Bekleyen debounce'lu kaydı hemen (senkron) yazar; çıkışta ve kapanışta çağrılır."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_settings()
+    
+    def _write_settings_file(self, payload: bytes, seq: int) -> None:
+        """Ayar içeriğini yazar; daha yeni bir içerik zaten yazıldıysa atlar."""
+        with self._write_lock:
+            if seq < self._written_seq:
+                return
+            _atomic_write(self.settings_file, payload)
+            self._written_seq = seq
+    
+    def _serialize_settings(self) -> bytes:
+        """Ayarları kompakt JSON olarak tek bir bytes tamponuna serialize eder."""
+        return _dumps(self._build_settings_data(), pretty=self.PRETTY_JSON)
+    
+    def dump_settings_pretty(self) -> str:
+        """
+        Mevcut ayarları okunabilir (girintili) JSON olarak döner.
+        
+        Returns:
+            str: Hata ayıklama için girintili JSON
+        """
+        return _dumps(self._build_settings_data(), pretty=True).decode("utf-8")
+    
+    def _build_settings_data(self) -> Dict:
+        """Kaydedilecek ayar sözlüğünü oluşturur (listeler kopyalanmaz, json değiştirmez)."""
+        return {
+            "slideshow_config": self.slideshow_config._as_json_dict(),
+            "monitor_settings": {
+                name: settings._as_json_dict() for name, settings in self.monitor_settings.items()
+            }
+        }
+    
     def load_settings(self) -> bool:
         """
         Monitör ayarlarını dosyadan yükler.
@@ -367,13 +564,12 @@ class MonitorManager(QObject):
                 logger.debug("Monitör ayarları dosyası bulunamadı, varsayılan ayarlar kullanılıyor")
                 return False
             
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings_data = json.load(f)
+            settings_data = _loads(self.settings_file.read_bytes())
             
             # Slideshow config'i yükle
             if "slideshow_config" in settings_data:
                 config_data = settings_data["slideshow_config"]
-                config_data["mode"] = SlideshowMode(config_data["mode"])
+                config_data["mode"] = _MODE_BY_VALUE[config_data["mode"]]
                 self.slideshow_config = SlideshowConfig(**config_data)
             
             # Monitör ayarlarını yükle
@@ -388,6 +584,35 @@ class MonitorManager(QObject):
             logger.error(f"Monitör ayarları yüklenirken hata: {e}")
             return False
     
+    def _get_active_names(self) -> List[str]:
+        """Aktif monitör adlarını önbellekten döner."""
+        if self._active_names_cache is None:
+            self._active_names_cache = list(compress(self._names, self._is_active))
+        return self._active_names_cache
+    
+    def _schedule_config_changed(self) -> None:
+        """Konfigürasyon değişikliği sinyalini bir sonraki event loop turuna erteler."""
+        if not self._config_dirty:
+            self._config_dirty = True
+            QTimer.singleShot(0, self._emit_config_changed)
+    
+    def _emit_config_changed(self) -> None:
+        """Bekleyen konfigürasyon değişikliği sinyalini emit eder."""
+        self._config_dirty = False
+        self.monitor_configuration_changed.emit()
+    
+    def _rebuild_monitor_arrays(self) -> None:
+        """self.monitors'tan paralel ad/aktif/primary dizilerini yeniden oluşturur."""
+        monitors = self.monitors.values()
+        self._names = [m.name for m in monitors]
+        self._is_active = [m.is_active for m in monitors]
+        self._is_primary = [m.is_primary for m in monitors]
+    
+    def _invalidate_active_cache(self) -> None:
+        """Aktif monitör önbelleğini geçersiz kılar."""
+        self._active_monitors_cache = None
+        self._active_names_cache = None
+    
     def _apply_wallpaper_to_monitor(self, monitor_name: str, wallpaper_id: str) -> bool:
         """
         Wallpaper'ı belirli monitöre uygular (WallpaperEngine üzerinden).
@@ -428,19 +653,9 @@ class MonitorManager(QObject):
     
     def _start_independent_slideshow(self) -> None:
         """Bağımsız slideshow'u başlatır."""
-        active_monitors = [name for name, monitor in self.monitors.items() if monitor.is_active]
+        active_monitors = self._get_active_names()
         
-        for monitor_name in active_monitors:
-            if monitor_name not in self.monitor_timers:
-                timer = QTimer()
-                timer.timeout.connect(lambda mn=monitor_name: self._on_monitor_slideshow_timeout(mn))
-                self.monitor_timers[monitor_name] = timer
-            
-            # Monitor-specific timer interval'ı al
-            settings = self.monitor_settings.get(monitor_name)
-            interval = settings.custom_timer if settings and settings.custom_timer else self.slideshow_config.timer_interval
-            
-            self.monitor_timers[monitor_name].start(interval * 1000)
+        self._start_bucket_timers(active_monitors)
         
         logger.debug(f"Bağımsız slideshow başlatıldı: {len(active_monitors)} monitör")
     
@@ -451,28 +666,61 @@ class MonitorManager(QObject):
             self.slideshow_timer.start(self.slideshow_config.timer_interval * 1000)
         
         # Bağımsız monitörler için ayrı timer'lar
-        active_monitors = [name for name, monitor in self.monitors.items() if monitor.is_active]
+        active_monitors = self._get_active_names()
         independent_monitors = [m for m in active_monitors if m not in self.slideshow_config.synchronized_monitors]
         
-        for monitor_name in independent_monitors:
-            if monitor_name not in self.monitor_timers:
-                timer = QTimer()
-                timer.timeout.connect(lambda mn=monitor_name: self._on_monitor_slideshow_timeout(mn))
-                self.monitor_timers[monitor_name] = timer
-            
+        self._start_bucket_timers(independent_monitors)
+        
+        logger.debug("Karışık slideshow başlatıldı")
+    
+    def _start_bucket_timers(self, monitor_names: List[str]) -> None:
+        """
+        Monitörleri timer aralığına göre gruplar ve her grup için tek timer başlatır.
+        
+        Args:
+            monitor_names: Bağımsız çalışacak monitör adları
+        """
+        interval_buckets: Dict[int, List[str]] = {}
+        for monitor_name in monitor_names:
+            # Monitor-specific timer interval'ı al
             settings = self.monitor_settings.get(monitor_name)
             interval = settings.custom_timer if settings and settings.custom_timer else self.slideshow_config.timer_interval
-            
-            self.monitor_timers[monitor_name].start(interval * 1000)
+            interval_buckets.setdefault(interval, []).append(monitor_name)
         
-        logger.debug("Karışık slideshow başlatıldı")
+        # Artık kullanılmayan grupların timer'larını havuza geri ver
+        for interval in [i for i in self._bucket_timers if i not in interval_buckets]:
+            self._release_bucket_timer(interval)
+        
+        self._timer_buckets = interval_buckets
+        
+        for interval in interval_buckets:
+            timer = self._bucket_timers.get(interval)
+            if timer is None:
+                timer = self._timer_pool.pop() if self._timer_pool else QTimer()
+                timer.timeout.connect(partial(self._tick_bucket, interval))
+                self._bucket_timers[interval] = timer
+            timer.start(interval * 1000)
+    
+    def _release_bucket_timer(self, interval: int) -> None:
+        """Grup timer'ını durdurur, bağlantısını keser ve havuza geri koyar."""
+        timer = self._bucket_timers.pop(interval, None)
+        if timer is None:
+            return
+        timer.stop()
+        timer.timeout.disconnect()
+        self._timer_pool.append(timer)
+    
+    def _tick_bucket(self, interval: int) -> None:
+        """Aynı aralığı paylaşan monitörlerin slideshow tick'i."""
+        for monitor_name in self._timer_buckets.get(interval, ()):
+            self._on_monitor_slideshow_timeout(monitor_name)
     
     def _on_slideshow_timeout(self) -> None:
         """Senkronize slideshow timeout'u."""
         try:
             # Senkronize monitörleri al
-            if self.slideshow_config.mode == SlideshowMode.SYNCHRONIZED:
-                target_monitors = [name for name, monitor in self.monitors.items() if monitor.is_active]
+            if self.slideshow_config.mode is SlideshowMode.SYNCHRONIZED:
+                target_monitors = self._get_active_names()
             else:  # MIXED mode
                 target_monitors = self.slideshow_config.synchronized_monitors
             
@@ -489,7 +737,8 @@ class MonitorManager(QObject):
     def _on_monitor_slideshow_timeout(self, monitor_name: str) -> None:
         """Monitör-specific slideshow timeout'u."""
         try:
-            if monitor_name not in self.monitors or not self.monitors[monitor_name].is_active:
+            monitor = self.monitors.get(monitor_name)
+            if monitor is None or not monitor.is_active:
                 return
             
             # TODO: Bu monitör için playlist'ten sonraki wallpaper'ı al ve uygula
@@ -1,15 +1,157 @@
 """
 Playlist yönetimi için sınıf
 """
+import atexit
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import random
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, KeysView
 from pathlib import Path
 
 from utils import SETTINGS_FILE, DEFAULT_TIMER_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# orjson varsa C tabanlı serializer kullan, yoksa stdlib json'a düş
+# (orjson.JSONDecodeError, json.JSONDecodeError'dan türer).
+# Dosya girintisiz (kompakt) yazılır; diğer JSON okuyucularla uyumlu kalır.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
+# msgspec varsa ayarlar tipli bir şema üzerinden encode/decode edilir:
+# encode sırasında ara dict oluşturulmaz, decode sırasında tipler doğrulanır
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _PlaylistSettings(msgspec.Struct):
+        """settings.json içindeki playlist alanlarının şeması (diğer anahtarlar yok sayılır)."""
+        playlists: Dict[str, List[str]] = {}
+        recent: List[str] = []
+        timer_interval: int = DEFAULT_TIMER_INTERVAL
+        custom_timer_text: Optional[str] = None
+        is_random: bool = False
+        current_playlist: List[str] = []
+        current_index: int = 0
+        is_playing: bool = False
+
+    _settings_encoder = msgspec.json.Encoder()
+    _settings_decoder = msgspec.json.Decoder(_PlaylistSettings)
+    _DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError, msgspec.DecodeError)
+
+    def _decode_settings(raw: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Ayar dosyasını şema üzerinden decode eder.
+        
+        Tipi hatalı bir alan dosyanın tamamını geçersiz kılmaz; yalnızca o
+        alan varsayılan değerine döner.
+        
+        Returns:
+            Optional[Dict]: Ayarlar, kök bir JSON nesnesi değilse None
+        """
+        try:
+            return msgspec.structs.asdict(_settings_decoder.decode(raw))
+        except msgspec.ValidationError:
+            obj = msgspec.json.decode(raw)
+        if not isinstance(obj, dict):
+            return None
+        fields = {}
+        for field in msgspec.structs.fields(_PlaylistSettings):
+            if field.name not in obj:
+                continue
+            try:
+                fields[field.name] = msgspec.convert(obj[field.name], field.type)
+            except msgspec.ValidationError as e:
+                logger.warning(f"Geçersiz ayar alanı varsayılana döndü ({field.name}): {e}")
+        return msgspec.structs.asdict(_PlaylistSettings(**fields))
+else:
+    _DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+    # Şema olmadan doğrulanan alanlar ve beklenen tipleri
+    _SETTINGS_TYPES = {
+        'playlists': dict,
+        'recent': list,
+        'timer_interval': int,
+        'custom_timer_text': (str, type(None)),
+        'is_random': bool,
+        'current_playlist': list,
+        'current_index': int,
+        'is_playing': bool,
+    }
+
+    def _decode_settings(raw: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Ayar dosyasını decode edip alan tiplerini doğrular.
+        
+        Tipi hatalı alanlar atlanır (yükleme sırasında varsayılan kullanılır).
+        
+        Returns:
+            Optional[Dict]: Ayarlar, kök bir JSON nesnesi değilse None
+        """
+        obj = _loads(raw)
+        if not isinstance(obj, dict):
+            return None
+        data = {}
+        for name, expected in _SETTINGS_TYPES.items():
+            if name not in obj:
+                continue
+            value = obj[name]
+            valid = isinstance(value, expected)
+            if valid and expected is int:
+                valid = not isinstance(value, bool)
+            elif valid and name == 'playlists':
+                valid = all(isinstance(v, list) for v in value.values())
+            if valid:
+                data[name] = value
+            else:
+                logger.warning(f"Geçersiz ayar alanı varsayılana döndü ({name}): {type(value).__name__}")
+        return data
+
+# Son kullanılanlar listesinde tutulacak en fazla wallpaper sayısı
+MAX_RECENT_WALLPAPERS = 20
+
+# Ardışık kayıt isteklerinin birleştirildiği süre (saniye)
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+class _LazySetting:
+    """
+    Ayar dosyasından gelen attribute'lar için descriptor.
+    
+    İlk okuma veya yazmada ayar dosyası yüklenir; böylece dosya okuma ve
+    JSON parse işlemi uygulama açılışının kritik yolundan çıkar.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attr = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if not instance._loaded:
+            instance._ensure_loaded()
+        return instance.__dict__[self.attr]
+
+    def __set__(self, instance, value):
+        if not instance._loaded:
+            instance._ensure_loaded()
+        instance.__dict__[self.attr] = value
+
 
 class PlaylistManager:
     """
@@ -23,18 +165,84 @@ class PlaylistManager:
         timer_interval: Wallpaper değiştirme aralığı (saniye)
         recent_wallpapers: Son kullanılan wallpaper'lar
         playlists: Kaydedilmiş playlist'ler
+    
+    Ayarlar bu attribute'lardan birine ilk erişildiğinde yüklenir.
     """
     
+    current_index = _LazySetting()
+    is_playing = _LazySetting()
+    is_random = _LazySetting()
+    timer_interval = _LazySetting()
+    custom_timer_text = _LazySetting()
+    recent_wallpapers = _LazySetting()
+    playlists = _LazySetting()
+    
     def __init__(self):
-        self.current_playlist: List[str] = []
-        self.current_index: int = 0
-        self.is_playing: bool = False
-        self.is_random: bool = False
-        self.timer_interval: int = DEFAULT_TIMER_INTERVAL
-        self.custom_timer_text: Optional[str] = None  # Özel timer metni
-        self.recent_wallpapers: List[str] = []
-        self.playlists: Dict[str, List[str]] = {}
+        # Varsayılanlar doğrudan arka alanlara yazılır (yüklemeyi tetiklememek için)
+        self._loaded = False
+        self._current_playlist: List[str] = []
+        self._current_set: set = set()  # current_playlist için üyelik indeksi
+        self._current_shared = False  # current_playlist kayıtlı bir playlist ile paylaşılıyor mu (copy-on-write)
+        self._current_index: int = 0
+        self._is_playing: bool = False
+        self._is_random: bool = False
+        self._timer_interval: int = DEFAULT_TIMER_INTERVAL
+        self._custom_timer_text: Optional[str] = None  # Özel timer metni
+        # Sıralı LRU: anahtarlar wallpaper ID'leri, en yenisi sonda
+        self._recent_wallpapers: "OrderedDict[str, None]" = OrderedDict()
+        self._playlists: Dict[str, List[str]] = {}
+        
+        # Debounce'lu kayıt durumu
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_payload_hash: int = 0  # Son yazılan içeriğin hash'i (değişmemişse yazma atlanır)
+        self._dir_ready = False  # Ayar dizini bir kez oluşturulduktan sonra tekrar kontrol edilmez
+        self._load_failed = False  # Okunamayan ayar dosyası ilk kayıttan önce yedeklenir
         
+        # Her kayıtta yeniden kullanılan serialize şablonu (anahtar sırası dosya düzenini belirler)
+        self._persist: Dict[str, Any] = dict.fromkeys((
+            'playlists', 'recent', 'timer_interval', 'custom_timer_text', 'is_random',
+            'current_playlist', 'current_index', 'is_playing'
+        ))
+        
+        # Uygulama kapanırken bekleyen kaydı diske yaz
+        atexit.register(self._flush)
+
+    @property
+    def current_playlist(self) -> List[str]:
+        """Aktif playlist (sıra korunur)."""
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._current_playlist
+
+    @current_playlist.setter
+    def current_playlist(self, wallpapers: List[str]) -> None:
+        if not self._loaded:
+            self._ensure_loaded()
+        # Liste değiştirildiğinde üyelik indeksini de yeniden kur
+        self._current_playlist = wallpapers
+        self._current_set = set(wallpapers)
+        self._current_shared = False
+
+    def _writable_current_playlist(self) -> List[str]:
+        """
+        Değiştirilebilir aktif playlist'i döner.
+        
+        Liste kayıtlı bir playlist ile paylaşılıyorsa ilk değişiklikten önce kopyalanır.
+        """
+        playlist = self.current_playlist
+        if self._current_shared:
+            playlist = self._current_playlist = playlist.copy()
+            self._current_shared = False
+        return playlist
+
+    def _ensure_loaded(self) -> None:
+        """Ayarlar henüz yüklenmediyse bir kez yükler."""
+        if self._loaded:
+            return
+        self._loaded = True
         self.load_settings()
 
     def load_settings(self) -> bool:
@@ -49,11 +257,16 @@ class PlaylistManager:
             return False
             
         try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = SETTINGS_FILE.read_bytes()
+            # Eksik ve tipi hatalı alanlar varsayılanlarla doldurulur
+            data = _decode_settings(raw)
+            if data is None:
+                self._load_failed = True
+                logger.error("Ayar dosyası beklenen formatta değil, varsayılan ayarlar kullanılıyor")
+                return False
                 
             self.playlists = data.get('playlists', {})
-            self.recent_wallpapers = data.get('recent', [])
+            self.recent_wallpapers = OrderedDict.fromkeys(data.get('recent', [])[-MAX_RECENT_WALLPAPERS:])
             self.timer_interval = data.get('timer_interval', DEFAULT_TIMER_INTERVAL)
             self.custom_timer_text = data.get('custom_timer_text', None)
             self.is_random = data.get('is_random', False)
@@ -65,46 +278,135 @@ class PlaylistManager:
             logger.info("Ayarlar başarıyla yüklendi")
             return True
             
-        except json.JSONDecodeError as e:
+        except _DECODE_ERRORS as e:
+            self._load_failed = True
             logger.error(f"Ayar dosyası JSON formatında değil: {e}")
             return False
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Ayarlar yüklenirken hata: {e}")
             return False
 
     def save_settings(self) -> bool:
+        """
+        Ayarların kaydedilmesini planlar.
+        
+        Kısa aralıklarla gelen çağrılar tek bir disk yazımına birleştirilir;
+        bekleyen kayıt uygulama kapanırken de yazılır.
+        
+        Returns:
+            bool: Kayıt planlandıysa True
+        """
+        self._dirty = True
+        with self._timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._save_settings_now)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+        return True
+
+    def _mark_dirty(self) -> None:
+        """
+        Durumu kaydedilmemiş olarak işaretler, yazım planlamaz.
+        
+        Değişiklik bir sonraki save_settings() çağrısında veya çıkışta yazılır.
+        """
+        self._dirty = True
+
+    def _flush(self) -> bool:
+        """
+        Bekleyen kayıt varsa hemen diske yazar.
+        
+        Returns:
+            bool: Kaydetme başarılı ise (veya bekleyen kayıt yoksa) True
+        """
+        with self._timer_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        if not self._dirty:
+            return True
+        return self._save_settings_now()
+
+    def _save_settings_now(self) -> bool:
         """
         Ayarları dosyaya kaydeder.
         
         Returns:
             bool: Kaydetme başarılı ise True
         """
+        with self._write_lock:
+            return self._write_settings()
+
+    def _write_settings(self) -> bool:
+        """Ayarları serialize edip diske yazar."""
+        # Yazım sırasında gelen değişiklikler yeni bir kayıt planlar
+        self._dirty = False
         try:
-            # Dizini oluştur
-            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # Dizini (sadece ilk kayıtta) oluştur
+            if not self._dir_ready:
+                SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
             
-            data = {
-                'playlists': self.playlists,
-                'recent': self.recent_wallpapers[-20:],  # Son 20'yi sakla
-                'timer_interval': self.timer_interval,
-                'custom_timer_text': self.custom_timer_text,
-                'is_random': self.is_random,
-                # State persistence için ekledik
-                'current_playlist': self.current_playlist,
-                'current_index': self.current_index,
-                'is_playing': self.is_playing
-            }
+            # Önce tamamen encode et; içerik değişmediyse diske hiç dokunma
+            payload = self._encode_settings()
+            payload_hash = hash(payload)
+            if payload_hash == self._last_payload_hash:
+                logger.debug("Ayarlar değişmedi, kayıt atlandı")
+                return True
             
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Okunamayan dosyanın üzerine yazmadan önce onu yedekle
+            if self._load_failed:
+                backup = SETTINGS_FILE.with_suffix('.json.bak')
+                try:
+                    os.replace(SETTINGS_FILE, backup)
+                    logger.warning(f"Okunamayan ayar dosyası yedeklendi: {backup}")
+                except FileNotFoundError:
+                    pass
+                self._load_failed = False
+            
+            # Geçici dosyaya yaz ve atomik olarak yer değiştir
+            tmp_file = SETTINGS_FILE.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, SETTINGS_FILE)
+            self._last_payload_hash = payload_hash
                 
             logger.info("Ayarlar başarıyla kaydedildi")
             return True
             
         except Exception as e:
+            self._dirty = True
             logger.error(f"Ayarlar kaydedilirken hata: {e}")
             return False
 
+    def _encode_settings(self) -> bytes:
+        """Kaydedilecek ayarları JSON bytes olarak encode eder."""
+        if msgspec is not None:
+            settings = _PlaylistSettings(
+                playlists=self.playlists,
+                recent=list(self.recent_wallpapers),
+                timer_interval=self.timer_interval,
+                custom_timer_text=self.custom_timer_text,
+                is_random=self.is_random,
+                current_playlist=self.current_playlist,
+                current_index=self.current_index,
+                is_playing=self.is_playing
+            )
+            return _settings_encoder.encode(settings)
+        
+        # Şablonu yerinde güncelle (attribute'lar yeniden atanabildiği için hepsi yazılır)
+        data = self._persist
+        data['playlists'] = self.playlists
+        data['recent'] = list(self.recent_wallpapers)  # add_to_recent zaten 20 ile sınırlar
+        data['timer_interval'] = self.timer_interval
+        data['custom_timer_text'] = self.custom_timer_text
+        data['is_random'] = self.is_random
+        # State persistence için ekledik
+        data['current_playlist'] = self.current_playlist
+        data['current_index'] = self.current_index
+        data['is_playing'] = self.is_playing
+        return _dumps(data)
+
     def add_to_recent(self, wallpaper_id: str) -> None:
         """
         Wallpaper'ı son kullanılanlara ekler.
@@ -115,16 +417,13 @@ class PlaylistManager:
         if not wallpaper_id:
             return
             
-        # Eğer zaten varsa çıkar
-        if wallpaper_id in self.recent_wallpapers:
-            self.recent_wallpapers.remove(wallpaper_id)
-            
-        # En başa ekle
-        self.recent_wallpapers.append(wallpaper_id)
+        # Eğer zaten varsa çıkar, en yeni olarak sona ekle (O(1))
+        self.recent_wallpapers.pop(wallpaper_id, None)
+        self.recent_wallpapers[wallpaper_id] = None
         
-        # Maksimum 20 tane sakla
-        if len(self.recent_wallpapers) > 20:
-            self.recent_wallpapers = self.recent_wallpapers[-20:]
+        # Maksimum 20 tane sakla, en eskileri at
+        while len(self.recent_wallpapers) > MAX_RECENT_WALLPAPERS:
+            self.recent_wallpapers.popitem(last=False)
             
         self.save_settings()
         logger.debug(f"'{wallpaper_id}' son kullanılanlara eklendi")
@@ -144,7 +443,10 @@ class PlaylistManager:
             logger.warning("Playlist adı veya wallpaper listesi boş")
             return False
             
-        self.playlists[name] = wallpapers.copy()
+        # Kopyalamadan sakla; aktif playlist verildiyse ilk değişiklikte kopyalanır
+        self.playlists[name] = wallpapers if isinstance(wallpapers, list) else list(wallpapers)
+        if wallpapers is self._current_playlist:
+            self._current_shared = True
         self.save_settings()
         logger.info(f"'{name}' playlist'i oluşturuldu ({len(wallpapers)} wallpaper)")
         return True
@@ -182,7 +484,9 @@ class PlaylistManager:
             logger.warning(f"'{name}' playlist'i bulunamadı")
             return False
             
-        self.current_playlist = self.playlists[name].copy()
+        # Kayıtlı liste paylaşılır, aktif playlist ilk değişiklikte kopyalanır (copy-on-write)
+        self.current_playlist = self.playlists[name]
+        self._current_shared = True
         self.current_index = 0
         self.save_settings()  # State'i kaydet
         logger.info(f"'{name}' playlist'i yüklendi ({len(self.current_playlist)} wallpaper)")
@@ -201,8 +505,10 @@ class PlaylistManager:
         if not wallpaper_id:
             return False
             
-        if wallpaper_id not in self.current_playlist:
-            self.current_playlist.append(wallpaper_id)
+        self._ensure_loaded()
+        if wallpaper_id not in self._current_set:
+            self._writable_current_playlist().append(wallpaper_id)
+            self._current_set.add(wallpaper_id)
             logger.debug(f"'{wallpaper_id}' aktif playlist'e eklendi")
             return True
         else:
@@ -219,24 +525,32 @@ class PlaylistManager:
         Returns:
             bool: Çıkarma başarılı ise True
         """
-        if 0 <= index < len(self.current_playlist):
-            removed = self.current_playlist.pop(index)
-            
-            # Eğer current_index etkilendiyse ayarla
-            if index <= self.current_index and self.current_index > 0:
-                self.current_index -= 1
-            elif self.current_index >= len(self.current_playlist) and self.current_playlist:
-                self.current_index = 0
-                
-            logger.debug(f"'{removed}' aktif playlist'ten çıkarıldı")
-            return True
-        else:
+        n = len(self.current_playlist)
+        if not 0 <= index < n:
             logger.warning(f"Geçersiz indeks: {index}")
             return False
+            
+        playlist = self._writable_current_playlist()
+        removed = playlist.pop(index)
+        n -= 1
+        if removed not in playlist:
+            self._current_set.discard(removed)
+        
+        # Eğer current_index etkilendiyse ayarla
+        current = self.current_index
+        if 0 < current and index <= current:
+            current -= 1
+        elif current >= n and n:
+            current = 0
+        self.current_index = current
+            
+        logger.debug(f"'{removed}' aktif playlist'ten çıkarıldı")
+        return True
 
     def clear_current_playlist(self) -> None:
         """Aktif playlist'i temizler."""
-        self.current_playlist.clear()
+        self._writable_current_playlist().clear()
+        self._current_set.clear()
         self.current_index = 0
         self.is_playing = False
         logger.info("Aktif playlist temizlendi")
@@ -270,16 +584,16 @@ class PlaylistManager:
         Returns:
             str: Wallpaper ID'si veya None
         """
-        if not self.current_playlist:
+        n = len(self.current_playlist)
+        if not n:
             return None
             
         if random_mode:
-            import random
-            self.current_index = random.randint(0, len(self.current_playlist) - 1)
+            self.current_index = random.randrange(n)
         else:
-            self.current_index = (self.current_index + 1) % len(self.current_playlist)
+            self.current_index = (self.current_index + 1) % n
         
-        self.save_settings()  # Index değişti, kaydet
+        self._mark_dirty()  # Index değişti, bir sonraki kayıtta/çıkışta yazılır
         return self.get_current_wallpaper()
 
     def get_previous_wallpaper(self) -> Optional[str]:
@@ -289,13 +603,23 @@ class PlaylistManager:
         Returns:
             str: Wallpaper ID'si veya None
         """
-        if not self.current_playlist:
+        n = len(self.current_playlist)
+        if not n:
             return None
             
-        self.current_index = (self.current_index - 1) % len(self.current_playlist)
-        self.save_settings()  # Index değişti, kaydet
+        self.current_index = (self.current_index - 1) % n
+        self._mark_dirty()  # Index değişti, bir sonraki kayıtta/çıkışta yazılır
         return self.get_current_wallpaper()
 
+    def get_saved_playlist_names(self) -> KeysView:
+        """
+        Kaydedilmiş playlist adlarını kopyalamadan döner.
+        
+        Returns:
+            KeysView: Playlist adlarının canlı görünümü
+        """
+        return self.playlists.keys()
+
     def get_playlist_info(self) -> Dict[str, Any]:
         """
         Playlist bilgilerini döner.
@@ -309,7 +633,7 @@ class PlaylistManager:
             "is_playing": self.is_playing,
             "is_random": self.is_random,
             "timer_interval": self.timer_interval,
-            "saved_playlists": list(self.playlists.keys()),
+            "saved_playlists": tuple(self.playlists),
             "recent_count": len(self.recent_wallpapers),
             "custom_timer_text": self.custom_timer_text
         }
@@ -1,15 +1,153 @@
 """
 Wallpaper Engine dinamik kontrol sistemi
 """
+import atexit
+import functools
 import logging
 import os
+import selectors
 import subprocess
 import signal
-from typing import Dict, Any, Optional
+import shutil
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
+import psutil
+
+try:
+    from utils.ffmpeg_utils import apply_sixel_wallpaper, is_sixel_available
+except ImportError:
+    apply_sixel_wallpaper = is_sixel_available = None
+
 logger = logging.getLogger(__name__)
 
+# Eski (takip edilmeyen) wallpaper process'leri için tek pkill deseni
+_STOP_PATTERN = '(linux-wallpaperengine|swww|mpv.*wallpaper|mpvpaper)'
+# Durdurulan process'ler için SIGKILL öncesi bekleme süresi (saniye)
+_STOP_GRACE_PERIOD = 3
+# Açılıştaki arka plan wallpaper taraması için azami bekleme süresi (saniye)
+_DETECT_WAIT_TIMEOUT = 1.0
+# Ardışık ayar değişikliklerinin tek kayda birleştirileceği süre (saniye)
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Wallpaper çalışmıyorken döndürülen boş ayar görünümü
+_EMPTY_SETTINGS = MappingProxyType({})
+
+# Medya dosya uzantıları
+_VIDEO_SUFFIXES = frozenset({'.mp4', '.webm', '.mov'})
+_MEDIA_SUFFIXES = _VIDEO_SUFFIXES | {'.gif'}
+
+# Steam Workshop (Wallpaper Engine, app 431960) klasör adayları, öncelik sırasıyla
+_HOME = Path.home()
+_WORKSHOP_CANDIDATES = (
+    _HOME / ".steam" / "steam" / "steamapps" / "workshop" / "content" / "431960",
+    _HOME / ".local" / "share" / "Steam" / "steamapps" / "workshop" / "content" / "431960",
+)
+
+# mpv-wallpaper penceresi için Hyprland window rule'ları
+_HYPR_WINDOW_RULES = ('float', 'pin', 'noblur', 'noshadow', 'noborder')
+
+# KDE Plasma evaluateScript şablonları (tek değişken: dosya yolu)
+_KDE_IMAGE_SCRIPT = '''
+var allDesktops = desktops();
+for (i=0;i<allDesktops.length;i++) {
+    d = allDesktops[i];
+    d.wallpaperPlugin = "org.kde.image";
+    d.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");
+    d.writeConfig("Image", "file://%s");
+}
+'''
+
+_KDE_VIDEO_SCRIPT = '''
+var allDesktops = desktops();
+for (i=0;i<allDesktops.length;i++) {
+    d = allDesktops[i];
+    d.wallpaperPlugin = "com.github.casout.smartVideoWallpaper";
+    d.currentConfigGroup = Array("Wallpaper", "com.github.casout.smartVideoWallpaper", "General");
+    d.writeConfig("Video", "file://%s");
+}
+'''
+
+
+@functools.lru_cache(maxsize=1)
+def _steam_workshop_root() -> Path:
+    """
+    Steam Workshop (Wallpaper Engine) klasörünü bir kez tespit eder.
+    
+    Returns:
+        Path: Mevcut olan ilk Workshop klasörü (hiçbiri yoksa alternatif yol)
+    """
+    primary, fallback = _WORKSHOP_CANDIDATES
+    if primary.exists():
+        return primary
+    if not fallback.exists():
+        logger.warning("Steam Workshop klasörü bulunamadı: %s", fallback)
+    return fallback
+
+
+def _reap_if_dead(process: subprocess.Popen) -> bool:
+    """
+    Process sonlandıysa waitpid(WNOHANG) ile toplar.
+    
+    Popen.poll'un kilit ve durum nesnesi yükü olmadan sadece bu PID'i
+    toplar; waitpid(-1) başka kod yollarının child'larını da
+    toplayacağından kullanılmaz.
+    
+    Returns:
+        bool: Process sonlandıysa True
+    """
+    if process.returncode is not None:
+        return True
+    try:
+        pid, status = os.waitpid(process.pid, os.WNOHANG)
+    except ChildProcessError:
+        # Başka bir yerde toplanmış; Popen ile aynı şekilde davran
+        process.returncode = 0
+        return True
+    if pid == 0:
+        return False
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return True
+
+
+def _wait_process(process: subprocess.Popen, timeout: Optional[float]) -> bool:
+    """
+    Process'in sonlanmasını bekler.
+    
+    Linux'ta pidfd ile olay tabanlı bekler (periyodik uyanma yok); pidfd
+    desteklenmiyorsa Popen.wait'e düşer.
+    
+    Args:
+        process: Beklenecek process
+        timeout: Azami bekleme süresi (saniye), None ise süresiz
+        
+    Returns:
+        bool: Process süre dolmadan sonlandıysa True
+    """
+    if process.poll() is not None:
+        return True
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            ready = selector.select(timeout)
+    finally:
+        os.close(pidfd)
+    if ready:
+        process.wait()  # Process çıktı, sadece topla
+        return True
+    return False
+
 
 class WallpaperController:
     """
@@ -17,25 +155,139 @@ class WallpaperController:
     Mevcut wallpaper'ın ayarlarını anlık olarak değiştirir.
     """
     
+    # mpvpaper argümanları - tam ekran ve doğru scaling (ekran ve dosya sonradan eklenir)
+    _MPVPAPER_ARGS_PREFIX = (
+        'mpvpaper',
+        '-o', 'loop=inf --no-audio --really-quiet --video-zoom=0 --panscan=1.0 --video-aspect-override=no',
+    )
+    
+    # Hyprland için layer shell deneme
+    _MPV_ARGS_HYPR = (
+        'mpv',
+        '--loop=inf',
+        '--no-audio',
+        '--no-input-default-bindings',
+        '--no-osc',
+        '--no-border',
+        '--really-quiet',
+        '--vo=gpu',
+        '--gpu-context=wayland',
+        '--wayland-app-id=mpv-wallpaper',
+        '--no-focus-on-open',
+        '--geometry=100%x100%+0+0',
+        '--on-all-workspaces',
+        '--keep-open=yes',
+    )
+    
+    # Diğer Wayland compositor'lar için
+    _MPV_ARGS_WAYLAND = (
+        'mpv',
+        '--loop=inf',
+        '--no-audio',
+        '--no-input-default-bindings',
+        '--no-osc',
+        '--no-border',
+        '--fullscreen',
+        '--really-quiet',
+        '--vo=gpu',
+        '--gpu-context=wayland',
+        '--wayland-app-id=mpv-wallpaper',
+        '--no-focus-on-open',
+    )
+    
+    # X11 için parametreler
+    _MPV_ARGS_X11 = (
+        'mpv',
+        '--loop=inf',
+        '--no-audio',
+        '--wid=0',  # Root window
+        '--no-input-default-bindings',
+        '--no-osc',
+        '--no-border',
+        '--geometry=100%x100%+0+0',
+        '--really-quiet',
+    )
+    
+    # Desktop environment -> MPV komut hazırlayıcı metot adı (varsayılan: X11)
+    _MPV_CMD_BUILDERS = {
+        "wayland_hyprland": "_mpv_cmd_hypr",
+        "wayland_sway": "_mpv_cmd_wayland",
+        "wayland_generic": "_mpv_cmd_wayland",
+    }
+    
     def __init__(self, wallpaper_engine):
         self.wallpaper_engine = wallpaper_engine
         
         # Video wallpaper process yönetimi
         self.video_processes = {}  # {screen: process_info}
+        self._video_lock = threading.Lock()  # video_processes erişimi için (process kill'leri kilit dışında)
+        self._managed_procs = set()  # Bizim başlattığımız Popen nesneleri
+        self._hypr_rules_set = False  # Hyprland window rule'ları eklendi mi
+        self._applied_once = False  # Bu controller ile medya wallpaper uygulandı mı
+        self._tool_cache: Dict[str, Optional[str]] = {}  # {tool: path}
+        
+        # Ayar kaydı debounce durumu
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        
+        # Desktop environment process ömrü boyunca değişmez, bir kez tespit et
+        self.invalidate_desktop_env_cache()
         
         # Preset'ler kaldırıldı - gereksiz
         
+        atexit.register(self.flush)
         logger.info("WallpaperController başlatıldı")
     
+    def _have(self, name: str) -> bool:
+        """Harici bir aracın PATH'te olup olmadığını (önbellekli) kontrol eder."""
+        if name not in self._tool_cache:
+            self._tool_cache[name] = shutil.which(name)
+        return self._tool_cache[name] is not None
+    
+    def _schedule_save(self) -> None:
+        """
+        Wallpaper durumunun kaydedilmesini planlar.
+        
+        Slider sürüklenirken gelen ardışık çağrılar tek bir disk yazımına birleştirilir.
+        """
+        with self._save_lock:
+            self._save_pending = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._save_now)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _save_now(self) -> None:
+        """Bekleyen wallpaper durumunu diske yazar."""
+        with self._save_lock:
+            self._save_timer = None
+            if not self._save_pending:
+                return
+            self._save_pending = False
+        self.wallpaper_engine._save_state()
+    
+    def flush(self) -> None:
+        """Bekleyen kayıt varsa hemen diske yazar."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+        self._save_now()
+    
     def is_wallpaper_running(self) -> bool:
         """Wallpaper çalışıyor mu kontrol eder."""
         return self.wallpaper_engine.current_wallpaper is not None
     
-    def get_current_settings(self) -> Dict[str, Any]:
-        """Mevcut wallpaper ayarlarını döner."""
+    def get_current_settings(self) -> Mapping[str, Any]:
+        """
+        Mevcut wallpaper ayarlarını salt okunur bir görünüm olarak döner.
+        
+        Kopyalama yapılmaz; değiştirilebilir kopya gerekiyorsa dict(...) kullanın.
+        """
         if not self.is_wallpaper_running():
-            return {}
-        return self.wallpaper_engine.last_settings.copy()
+            return _EMPTY_SETTINGS
+        return MappingProxyType(self.wallpaper_engine.last_settings)
     
     def set_volume(self, volume: int) -> bool:
         """
@@ -55,9 +307,9 @@ class WallpaperController:
         
         # Sadece ayarları güncelle, restart yapma
         self.wallpaper_engine.last_settings["volume"] = volume
-        self.wallpaper_engine._save_state()
+        self._schedule_save()
         
-        logger.info(f"Ses seviyesi ayarı güncellendi: {volume}% (restart yok)")
+        logger.info("Ses seviyesi ayarı güncellendi: %d%% (restart yok)", volume)
         return True
     
     def toggle_silent(self) -> bool:
@@ -78,7 +330,7 @@ class WallpaperController:
         
         if success:
             status = "açıldı" if new_volume == 0 else "kapatıldı"
-            logger.info(f"Sessiz mod {status}")
+            logger.info("Sessiz mod %s", status)
         else:
             logger.error("Sessiz mod toggle edilemedi")
             
@@ -102,9 +354,9 @@ class WallpaperController:
         
         # Sadece ayarları güncelle, restart yapma
         self.wallpaper_engine.last_settings["fps"] = fps
-        self.wallpaper_engine._save_state()
+        self._schedule_save()
         
-        logger.info(f"FPS ayarı güncellendi: {fps} (restart yok)")
+        logger.info("FPS ayarı güncellendi: %d (restart yok)", fps)
         return True
     
     def toggle_mouse(self) -> bool:
@@ -123,10 +375,10 @@ class WallpaperController:
         
         # Sadece ayarları güncelle
         self.wallpaper_engine.last_settings["disable_mouse"] = new_mouse
-        self.wallpaper_engine._save_state()
+        self._schedule_save()
         
         status = "kapatıldı" if new_mouse else "açıldı"
-        logger.info(f"Mouse etkileşimi ayarı {status} (restart yok)")
+        logger.info("Mouse etkileşimi ayarı %s (restart yok)", status)
         return True
     
     def toggle_audio_processing(self) -> bool:
@@ -145,10 +397,10 @@ class WallpaperController:
         
         # Sadece ayarları güncelle
         self.wallpaper_engine.last_settings["no_audio_processing"] = new_proc
-        self.wallpaper_engine._save_state()
+        self._schedule_save()
         
         status = "kapatıldı" if new_proc else "açıldı"
-        logger.info(f"Ses işleme ayarı {status} (restart yok)")
+        logger.info("Ses işleme ayarı %s (restart yok)", status)
         return True
     
     def toggle_auto_mute(self) -> bool:
@@ -167,10 +419,10 @@ class WallpaperController:
         
         # Sadece ayarları güncelle
         self.wallpaper_engine.last_settings["noautomute"] = new_mute
-        self.wallpaper_engine._save_state()
+        self._schedule_save()
         
         status = "kapatıldı" if new_mute else "açıldı"
-        logger.info(f"Otomatik ses kısma ayarı {status} (restart yok)")
+        logger.info("Otomatik ses kısma ayarı %s (restart yok)", status)
         return True
     
     # Preset fonksiyonları kaldırıldı - gereksiz
@@ -205,76 +457,90 @@ class WallpaperController:
             bool: Başarılı ise True
         """
         try:
-            import subprocess
-            import os
-            from pathlib import Path
-            
             media_file = Path(media_path)
             if not media_file.exists():
-                logger.error(f"Medya dosyası bulunamadı: {media_path}")
+                logger.error("Medya dosyası bulunamadı: %s", media_path)
                 return False
             
             # Önce mevcut wallpaper engine process'lerini durdur
             self._stop_existing_wallpaper_processes()
             
             # Platform ve desktop environment tespiti
-            desktop_env = self._detect_desktop_environment()
-            logger.info(f"Desktop environment tespit edildi: {desktop_env}")
+            desktop_env = self._desktop_env
+            logger.info("Desktop environment tespit edildi: %s", desktop_env)
             
-            # Platform uyumlu wallpaper uygulaması
-            if desktop_env == "wayland_hyprland":
-                return self._apply_with_swww(media_file, screen)
-            elif desktop_env == "kde_plasma":
-                return self._apply_with_kde_plasma(media_file, screen)
-            elif desktop_env == "gnome":
-                return self._apply_with_gnome(media_file, screen)
-            elif desktop_env == "xfce":
-                return self._apply_with_xfce(media_file, screen)
-            else:
-                # Fallback: feh veya nitrogen
-                return self._apply_with_fallback(media_file, screen)
+            # Platform uyumlu wallpaper uygulaması (fallback: feh veya nitrogen)
+            handler = self._APPLY_DISPATCH.get(desktop_env, WallpaperController._apply_with_fallback)
+            success = handler(self, media_file, screen)
+            if success:
+                self._applied_once = True
+            return success
                 
         except Exception as e:
-            logger.error(f"Medya wallpaper uygulama hatası: {e}")
+            logger.error("Medya wallpaper uygulama hatası: %s", e)
             return False
     
     def _stop_existing_wallpaper_processes(self) -> None:
         """Mevcut wallpaper engine process'lerini durdurur."""
+        # Açılıştaki tarama bitmeden is_running() önceki oturumdan kalan engine'i göremez
+        self.wallpaper_engine.wait_for_detect(_DETECT_WAIT_TIMEOUT)
+        
         try:
-            import subprocess
-            
-            # Linux wallpaper engine process'lerini durdur
-            try:
-                result = subprocess.run(['pkill', '-f', 'linux-wallpaperengine'],
-                                      capture_output=True, timeout=5)
-                if result.returncode == 0:
-                    logger.info("Mevcut linux-wallpaperengine process'leri durduruldu")
-            except:
-                pass
-            
-            # Swww process'lerini durdur (GIF/video uygulanırken)
-            try:
-                subprocess.run(['pkill', '-f', 'swww'], capture_output=True, timeout=5)
-                logger.info("Swww process'leri durduruldu (GIF/video uygulama için)")
-            except:
-                pass
-            
-            # Video wallpaper process'lerini durdur
-            self.stop_video_wallpaper("all")
+            stopped = 0
+            # İlk uygulamada takip edilen process olamaz, bu adımı atla
+            if self._applied_once or self.video_processes or self._managed_procs:
+                # Takip ettiğimiz process'leri Popen üzerinden durdur (pkill taraması yok);
+                # çıkmış olanlar poll() ile ayıklandığından PID geri dönüşümü sorun olmaz
+                entries = self._tracked_entries()
+                stopped = self._stop_video_processes(entries, timeout=_STOP_GRACE_PERIOD)
+            
+            # Takip edilmeyen eski process'ler için tek bir pkill çağrısı
+            # (ilk uygulamada önceki oturumdan kalanlar, sonrasında başka kaynaklı wallpaper'lar)
+            if not stopped or self.wallpaper_engine.is_running():
+                try:
+                    result = subprocess.run(['pkill', '-f', _STOP_PATTERN],
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                    if result.returncode == 0:
+                        logger.info("Mevcut wallpaper process'leri durduruldu")
+                except (subprocess.SubprocessError, OSError):
+                    pass
             
-            # Kısa bekleme
-            import time
-            time.sleep(1)
+            # Video process kayıtlarını temizle (process'ler yukarıda durduruldu)
+            with self._video_lock:
+                self.video_processes.clear()
             
         except Exception as e:
-            logger.error(f"Wallpaper process durdurma hatası: {e}")
+            logger.error("Wallpaper process durdurma hatası: %s", e)
+    
+    def _tracked_entries(self) -> list:
+        """
+        Durdurulacak, hala çalışan takipli process'leri toplar.
+        
+        Returns:
+            list: _stop_video_processes için (screen, process_info) çiftleri
+        """
+        with self._video_lock:
+            entries = list(self.video_processes.items())
+        known = {id(info.get('process')) for _, info in entries}
+        # Kaydı olmayan (ör. ekranı değiştirilmiş) ama bizim başlattığımız process'ler
+        for process in tuple(self._managed_procs):
+            if process.poll() is not None:
+                self._managed_procs.discard(process)
+            elif id(process) not in known:
+                entries.append((f"pid {process.pid}", {'process': process, 'pgid': process.pid}))
+        return [(screen, info) for screen, info in entries
+                if info.get('process') and info['process'].poll() is None]
+    
+    def invalidate_desktop_env_cache(self) -> str:
+        """Önbellekteki desktop environment bilgisini ve ona bağlı MPV komut seçimini yeniler."""
+        self._desktop_env = self._detect_desktop_environment()
+        self._mpv_cmd_builder = getattr(
+            self, self._MPV_CMD_BUILDERS.get(self._desktop_env, '_mpv_cmd_x11'))
+        return self._desktop_env
     
     def _detect_desktop_environment(self) -> str:
         """Desktop environment'ı tespit eder."""
         try:
-            import os
-            import subprocess
-            
             # Wayland kontrolü
             if os.environ.get('WAYLAND_DISPLAY'):
                 # Hyprland kontrolü
@@ -304,27 +570,31 @@ class WallpaperController:
                 return "x11_generic"
                 
         except Exception as e:
-            logger.error(f"Desktop environment tespit hatası: {e}")
+            logger.error("Desktop environment tespit hatası: %s", e)
             return "unknown"
     
     def _apply_with_swww(self, media_file: Path, screen: str) -> bool:
         """Swww ile wallpaper uygular (Wayland/Hyprland) - Sixel fallback ile."""
         try:
-            import subprocess
+            suffix = media_file.suffix.lower()
             
             # Video dosyası mı kontrol et
-            if media_file.suffix.lower() in ['.mp4', '.webm', '.mov']:
+            if suffix in _VIDEO_SUFFIXES:
                 # Swww video desteklemiyor, önce Sixel dene
-                logger.info(f"Video dosyası tespit edildi, Sixel öncelikli fallback: {media_file.name}")
+                logger.info("Video dosyası tespit edildi, Sixel öncelikli fallback: %s", media_file.name)
                 if self._apply_sixel_wallpaper(media_file, screen):
                     return True
                 # Sixel başarısızsa MPV kullan
                 return self._apply_mpv_video_wallpaper(media_file, screen)
             
-            # Swww kontrolü (sadece resim/GIF için)
+            if not self._have('swww'):
+                logger.warning("Swww bulunamadı, Sixel fallback deneniyor...")
+                return self._apply_sixel_wallpaper(media_file, screen)
+            
+            # Swww daemon kontrolü (sadece resim/GIF için)
             try:
                 subprocess.run(['swww', 'query'],
-                             capture_output=True, check=True, timeout=5)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, timeout=5)
             except (subprocess.CalledProcessError, FileNotFoundError):
                 # Daemon başlat dene
                 logger.info("Swww daemon başlatılıyor...")
@@ -332,7 +602,6 @@ class WallpaperController:
                     subprocess.Popen(['swww', 'init'],
                                    stdout=subprocess.DEVNULL,
                                    stderr=subprocess.DEVNULL)
-                    import time
                     time.sleep(2)
                 except FileNotFoundError:
                     logger.warning("Swww bulunamadı, Sixel fallback deneniyor...")
@@ -349,22 +618,22 @@ class WallpaperController:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                logger.info(f"Swww ile medya wallpaper uygulandı: {media_file.name}")
+                logger.info("Swww ile medya wallpaper uygulandı: %s", media_file.name)
                 return True
             else:
-                logger.error(f"Swww hatası: {result.stderr}")
+                logger.error("Swww hatası: %s", result.stderr)
                 # Swww başarısız olursa Sixel fallback dene
                 logger.info("Swww başarısız, Sixel fallback deneniyor...")
                 if self._apply_sixel_wallpaper(media_file, screen):
                     return True
                 # Son çare olarak MPV
-                if media_file.suffix.lower() in ['.gif']:
+                if suffix == '.gif':
                     logger.info("Sixel de başarısız, MPV fallback deneniyor...")
                     return self._apply_mpv_video_wallpaper(media_file, screen)
                 return False
                 
         except Exception as e:
-            logger.error(f"Swww uygulama hatası: {e}")
+            logger.error("Swww uygulama hatası: %s", e)
             # Exception durumunda da Sixel fallback dene
             logger.info("Exception sonrası Sixel fallback deneniyor...")
             return self._apply_sixel_wallpaper(media_file, screen)
@@ -372,10 +641,8 @@ class WallpaperController:
     def _apply_with_kde_plasma(self, media_file: Path, screen: str) -> bool:
         """KDE Plasma ile wallpaper uygular."""
         try:
-            import subprocess
-            
             # Video dosyası mı kontrol et
-            if media_file.suffix.lower() in ['.mp4', '.webm', '.mov']:
+            if media_file.suffix.lower() in _VIDEO_SUFFIXES:
                 # KDE için video wallpaper plugin dene
                 return self._apply_kde_video_wallpaper(media_file, screen)
             else:
@@ -383,56 +650,38 @@ class WallpaperController:
                 cmd = [
                     'qdbus', 'org.kde.plasmashell', '/PlasmaShell',
                     'org.kde.PlasmaShell.evaluateScript',
-                    f'''
-                    var allDesktops = desktops();
-                    for (i=0;i<allDesktops.length;i++) {{
-                        d = allDesktops[i];
-                        d.wallpaperPlugin = "org.kde.image";
-                        d.currentConfigGroup = Array("Wallpaper", "org.kde.image", "General");
-                        d.writeConfig("Image", "file://{media_file}");
-                    }}
-                    '''
+                    _KDE_IMAGE_SCRIPT % media_file
                 ]
                 
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"KDE Plasma ile medya wallpaper uygulandı: {media_file.name}")
+                    logger.info("KDE Plasma ile medya wallpaper uygulandı: %s", media_file.name)
                     return True
                 else:
-                    logger.error(f"KDE Plasma hatası: {result.stderr}")
+                    logger.error("KDE Plasma hatası: %s", result.stderr)
                     return False
                 
         except Exception as e:
-            logger.error(f"KDE Plasma uygulama hatası: {e}")
+            logger.error("KDE Plasma uygulama hatası: %s", e)
             return False
     
     def _apply_kde_video_wallpaper(self, media_file: Path, screen: str) -> bool:
         """KDE Plasma için video wallpaper uygular."""
         try:
-            import subprocess
-            
             # KDE video wallpaper plugin kontrolü
             try:
                 # Smart Video Wallpaper plugin dene
                 cmd = [
                     'qdbus', 'org.kde.plasmashell', '/PlasmaShell',
                     'org.kde.PlasmaShell.evaluateScript',
-                    f'''
-                    var allDesktops = desktops();
-                    for (i=0;i<allDesktops.length;i++) {{
-                        d = allDesktops[i];
-                        d.wallpaperPlugin = "com.github.casout.smartVideoWallpaper";
-                        d.currentConfigGroup = Array("Wallpaper", "com.github.casout.smartVideoWallpaper", "General");
-                        d.writeConfig("Video", "file://{media_file}");
-                    }}
-                    '''
+                    _KDE_VIDEO_SCRIPT % media_file
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"KDE Smart Video Wallpaper ile uygulandı: {media_file.name}")
+                    logger.info("KDE Smart Video Wallpaper ile uygulandı: %s", media_file.name)
                     return True
                     
             except Exception:
@@ -442,21 +691,21 @@ class WallpaperController:
             return self._apply_mpv_video_wallpaper(media_file, screen)
                 
         except Exception as e:
-            logger.error(f"KDE video wallpaper hatası: {e}")
+            logger.error("KDE video wallpaper hatası: %s", e)
             return False
     
     def _apply_mpv_video_wallpaper(self, media_file: Path, screen: str) -> bool:
         """MPV ile video wallpaper uygular (evrensel çözüm)."""
         try:
-            # Desktop environment'ı tespit et
-            desktop_env = self._detect_desktop_environment()
+            # Desktop environment (önbellekten)
+            desktop_env = self._desktop_env
             
             # Mevcut video process'ini durdur
             self._stop_video_process(screen)
             
             # Genel video wallpaper process'lerini de durdur
             try:
-                subprocess.run(['pkill', '-f', '(mpv|mpvpaper).*wallpaper'], timeout=5)
+                subprocess.run(['pkill', '-f', '(mpv|mpvpaper).*wallpaper'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
             except:
                 pass
             
@@ -464,154 +713,100 @@ class WallpaperController:
             if desktop_env == "wayland_hyprland":
                 try:
                     # mpvpaper kontrolü
-                    subprocess.run(['mpvpaper', '--help'], capture_output=True, timeout=5)
+                    if not self._have('mpvpaper'):
+                        raise FileNotFoundError('mpvpaper')
                     
                     # mpvpaper ile wallpaper uygula - tam ekran ve doğru scaling
-                    cmd = [
-                        'mpvpaper',
-                        '-o', 'loop=inf --no-audio --really-quiet --video-zoom=0 --panscan=1.0 --video-aspect-override=no',
-                        screen if screen != "all" else "*",
-                        str(media_file)
-                    ]
+                    cmd = [*self._MPVPAPER_ARGS_PREFIX, screen if screen != "all" else "*", str(media_file)]
                     
                     process = subprocess.Popen(
                         cmd,
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL,
-                        preexec_fn=os.setsid
+                        start_new_session=True  # preexec_fn olmadan vfork/exec kullanılabilir
                     )
                     
                     # Process bilgisini kaydet
-                    self.video_processes[screen] = {
-                        'process': process,
-                        'file_path': str(media_file),
-                        'method': 'mpvpaper',
-                        'desktop_env': desktop_env
-                    }
+                    self._managed_procs.add(process)
+                    with self._video_lock:
+                        self.video_processes[screen] = {
+                            'process': process,
+                            'pgid': process.pid,  # setsid ile process kendi grubunun lideri
+                            'file_path': str(media_file),
+                            'method': 'mpvpaper',
+                            'desktop_env': desktop_env
+                        }
                     
-                    logger.info(f"mpvpaper ile video wallpaper başlatıldı: {media_file.name} (PID: {process.pid})")
+                    logger.info("mpvpaper ile video wallpaper başlatıldı: %s (PID: %s)", media_file.name, process.pid)
                     return True
                     
                 except FileNotFoundError:
                     logger.info("mpvpaper bulunamadı, standart MPV deneniyor...")
                 except Exception as e:
-                    logger.warning(f"mpvpaper hatası: {e}, standart MPV deneniyor...")
+                    logger.warning("mpvpaper hatası: %s, standart MPV deneniyor...", e)
             
             # Standart MPV fallback
-            try:
-                subprocess.run(['mpv', '--version'], capture_output=True, timeout=5)
-            except FileNotFoundError:
+            if not self._have('mpv'):
                 logger.error("MPV bulunamadı - video wallpaper için gerekli")
                 return False
             
-            # Desktop environment'a göre MPV parametrelerini ayarla
-            if desktop_env == "wayland_hyprland":
-                # Hyprland için layer shell deneme
-                cmd = [
-                    'mpv',
-                    '--loop=inf',
-                    '--no-audio',
-                    '--no-input-default-bindings',
-                    '--no-osc',
-                    '--no-border',
-                    '--really-quiet',
-                    '--vo=gpu',
-                    '--gpu-context=wayland',
-                    '--wayland-app-id=mpv-wallpaper',
-                    '--no-focus-on-open',
-                    '--geometry=100%x100%+0+0',
-                    '--on-all-workspaces',
-                    '--keep-open=yes',
-                    str(media_file)
-                ]
-                
-                # Hyprland window rule ekle
-                try:
-                    subprocess.run([
-                        'hyprctl', 'keyword', 'windowrule',
-                        'float,^(mpv-wallpaper)$'
-                    ], capture_output=True, timeout=5)
-                    subprocess.run([
-                        'hyprctl', 'keyword', 'windowrule',
-                        'pin,^(mpv-wallpaper)$'
-                    ], capture_output=True, timeout=5)
-                    subprocess.run([
-                        'hyprctl', 'keyword', 'windowrule',
-                        'noblur,^(mpv-wallpaper)$'
-                    ], capture_output=True, timeout=5)
-                    subprocess.run([
-                        'hyprctl', 'keyword', 'windowrule',
-                        'noshadow,^(mpv-wallpaper)$'
-                    ], capture_output=True, timeout=5)
-                    subprocess.run([
-                        'hyprctl', 'keyword', 'windowrule',
-                        'noborder,^(mpv-wallpaper)$'
-                    ], capture_output=True, timeout=5)
-                except:
-                    pass
-                    
-            elif desktop_env.startswith("wayland"):
-                # Diğer Wayland compositor'lar için
-                cmd = [
-                    'mpv',
-                    '--loop=inf',
-                    '--no-audio',
-                    '--no-input-default-bindings',
-                    '--no-osc',
-                    '--no-border',
-                    '--fullscreen',
-                    '--really-quiet',
-                    '--vo=gpu',
-                    '--gpu-context=wayland',
-                    '--wayland-app-id=mpv-wallpaper',
-                    '--no-focus-on-open',
-                    str(media_file)
-                ]
-            else:
-                # X11 için parametreler
-                cmd = [
-                    'mpv',
-                    '--loop=inf',
-                    '--no-audio',
-                    '--wid=0',  # Root window
-                    '--no-input-default-bindings',
-                    '--no-osc',
-                    '--no-border',
-                    '--geometry=100%x100%+0+0',
-                    '--really-quiet',
-                    str(media_file)
-                ]
+            # Desktop environment'a göre MPV parametrelerini ayarla (init'te seçildi)
+            cmd = self._mpv_cmd_builder(media_file)
             
             # Background process olarak başlat
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid  # Yeni process group
+                start_new_session=True  # Yeni process group, preexec_fn'siz hızlı spawn
             )
             
             # Process bilgisini kaydet
-            self.video_processes[screen] = {
-                'process': process,
-                'file_path': str(media_file),
-                'method': 'mpv',
-                'desktop_env': desktop_env
-            }
-            
-            logger.info(f"MPV ile video wallpaper başlatıldı: {media_file.name} (PID: {process.pid}, Screen: {screen})")
+            self._managed_procs.add(process)
+            with self._video_lock:
+                self.video_processes[screen] = {
+                    'process': process,
+                    'pgid': process.pid,  # setsid ile process kendi grubunun lideri
+                    'file_path': str(media_file),
+                    'method': 'mpv',
+                    'desktop_env': desktop_env
+                }
+            
+            logger.info("MPV ile video wallpaper başlatıldı: %s (PID: %s, Screen: %s)", media_file.name, process.pid, screen)
             return True
                 
         except Exception as e:
-            logger.error(f"MPV video wallpaper hatası: {e}")
+            logger.error("MPV video wallpaper hatası: %s", e)
             return False
     
+    def _mpv_cmd_hypr(self, media_file: Path) -> list:
+        """Hyprland için MPV komutunu hazırlar (layer shell deneme)."""
+        # Hyprland window rule'larını ekle (Hyprland'de kalıcı, bir kez yeterli)
+        if not self._hypr_rules_set:
+            try:
+                subprocess.run([
+                    'hyprctl', '--batch',
+                    ' ; '.join(f'keyword windowrule {rule},^(mpv-wallpaper)$'
+                               for rule in _HYPR_WINDOW_RULES)
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                self._hypr_rules_set = True
+            except (subprocess.SubprocessError, OSError):
+                pass
+        return [*self._MPV_ARGS_HYPR, str(media_file)]
+    
+    def _mpv_cmd_wayland(self, media_file: Path) -> list:
+        """Diğer Wayland compositor'lar için MPV komutunu hazırlar."""
+        return [*self._MPV_ARGS_WAYLAND, str(media_file)]
+    
+    def _mpv_cmd_x11(self, media_file: Path) -> list:
+        """X11 için MPV komutunu hazırlar."""
+        return [*self._MPV_ARGS_X11, str(media_file)]
+    
     def _apply_with_gnome(self, media_file: Path, screen: str) -> bool:
         """GNOME ile wallpaper uygular."""
         try:
-            import subprocess
-            
             # Video dosyası mı kontrol et
-            if media_file.suffix.lower() in ['.mp4', '.webm', '.mov']:
+            if media_file.suffix.lower() in _VIDEO_SUFFIXES:
                 # GNOME için video wallpaper çözümü
                 return self._apply_gnome_video_wallpaper(media_file, screen)
             else:
@@ -624,21 +819,19 @@ class WallpaperController:
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"GNOME ile medya wallpaper uygulandı: {media_file.name}")
+                    logger.info("GNOME ile medya wallpaper uygulandı: %s", media_file.name)
                     return True
                 else:
-                    logger.error(f"GNOME hatası: {result.stderr}")
+                    logger.error("GNOME hatası: %s", result.stderr)
                     return False
                 
         except Exception as e:
-            logger.error(f"GNOME uygulama hatası: {e}")
+            logger.error("GNOME uygulama hatası: %s", e)
             return False
     
     def _apply_gnome_video_wallpaper(self, media_file: Path, screen: str) -> bool:
         """GNOME için video wallpaper uygular."""
         try:
-            import subprocess
-            
             # GNOME Shell extension kontrolü (Wallpaper Slideshow)
             try:
                 # Hidamari extension dene
@@ -647,10 +840,10 @@ class WallpaperController:
                     'video-path', str(media_file)
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"GNOME Hidamari extension ile video uygulandı: {media_file.name}")
+                    logger.info("GNOME Hidamari extension ile video uygulandı: %s", media_file.name)
                     return True
                     
             except Exception:
@@ -660,14 +853,12 @@ class WallpaperController:
             return self._apply_mpv_video_wallpaper(media_file, screen)
                 
         except Exception as e:
-            logger.error(f"GNOME video wallpaper hatası: {e}")
+            logger.error("GNOME video wallpaper hatası: %s", e)
             return False
     
     def _apply_with_xfce(self, media_file: Path, screen: str) -> bool:
         """XFCE ile wallpaper uygular."""
         try:
-            import subprocess
-            
             # XFCE için xfconf-query kullan
             cmd = [
                 'xfconf-query', '-c', 'xfce4-desktop',
@@ -678,24 +869,22 @@ class WallpaperController:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                logger.info(f"XFCE ile medya wallpaper uygulandı: {media_file.name}")
+                logger.info("XFCE ile medya wallpaper uygulandı: %s", media_file.name)
                 return True
             else:
-                logger.error(f"XFCE hatası: {result.stderr}")
+                logger.error("XFCE hatası: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            logger.error(f"XFCE uygulama hatası: {e}")
+            logger.error("XFCE uygulama hatası: %s", e)
             return False
     
     def _apply_with_fallback(self, media_file: Path, screen: str) -> bool:
         """Fallback wallpaper uygulaması (feh/nitrogen) - Sixel fallback ile."""
         try:
-            import subprocess
-            
             # Video/GIF için önce Sixel dene
-            if media_file.suffix.lower() in ['.mp4', '.webm', '.mov', '.gif']:
-                logger.info(f"Video/GIF tespit edildi, Sixel öncelikli: {media_file.name}")
+            if media_file.suffix.lower() in _MEDIA_SUFFIXES:
+                logger.info("Video/GIF tespit edildi, Sixel öncelikli: %s", media_file.name)
                 if self._apply_sixel_wallpaper(media_file, screen):
                     return True
                 # Sixel başarısızsa MPV dene
@@ -704,26 +893,22 @@ class WallpaperController:
             
             # Statik resimler için geleneksel yöntemler
             # Feh dene
-            try:
+            if self._have('feh'):
                 cmd = ['feh', '--bg-scale', str(media_file)]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"Feh ile medya wallpaper uygulandı: {media_file.name}")
+                    logger.info("Feh ile medya wallpaper uygulandı: %s", media_file.name)
                     return True
-            except FileNotFoundError:
-                pass
             
             # Nitrogen dene
-            try:
+            if self._have('nitrogen'):
                 cmd = ['nitrogen', '--set-scaled', str(media_file)]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                 
                 if result.returncode == 0:
-                    logger.info(f"Nitrogen ile medya wallpaper uygulandı: {media_file.name}")
+                    logger.info("Nitrogen ile medya wallpaper uygulandı: %s", media_file.name)
                     return True
-            except FileNotFoundError:
-                pass
             
             # Son çare: Sixel (statik resimler için de)
             logger.info("Geleneksel tool'lar başarısız, Sixel fallback deneniyor...")
@@ -734,11 +919,19 @@ class WallpaperController:
             return False
                 
         except Exception as e:
-            logger.error(f"Fallback uygulama hatası: {e}")
+            logger.error("Fallback uygulama hatası: %s", e)
             # Exception durumunda da Sixel dene
             logger.info("Exception sonrası Sixel fallback deneniyor...")
             return self._apply_sixel_wallpaper(media_file, screen)
     
+    # Desktop environment -> uygulama metodu eşlemesi
+    _APPLY_DISPATCH = {
+        "wayland_hyprland": _apply_with_swww,
+        "kde_plasma": _apply_with_kde_plasma,
+        "gnome": _apply_with_gnome,
+        "xfce": _apply_with_xfce,
+    }
+    
     def delete_custom_wallpaper(self, wallpaper_id: str) -> bool:
         """
         Özel eklenen wallpaper'ı siler.
@@ -750,34 +943,42 @@ class WallpaperController:
             bool: Başarılı ise True
         """
         try:
-            import shutil
-            from pathlib import Path
-            
             # Custom wallpaper'ları kontrol et (custom_ ile başlayanlar)
             if not wallpaper_id.startswith('custom_') and not wallpaper_id.startswith('gif_'):
-                logger.warning(f"Sadece özel wallpaper'lar silinebilir: {wallpaper_id}")
+                logger.warning("Sadece özel wallpaper'lar silinebilir: %s", wallpaper_id)
                 return False
             
-            # Steam Workshop klasörü path'i
-            steam_workshop_path = Path.home() / ".steam" / "steam" / "steamapps" / "workshop" / "content" / "431960"
-            
-            if not steam_workshop_path.exists():
-                steam_workshop_path = Path.home() / ".local" / "share" / "Steam" / "steamapps" / "workshop" / "content" / "431960"
+            # Steam Workshop klasörü path'i (önbellekli)
+            wallpaper_path = _steam_workshop_root() / wallpaper_id
             
-            wallpaper_path = steam_workshop_path / wallpaper_id
-            
-            if wallpaper_path.exists() and wallpaper_path.is_dir():
-                shutil.rmtree(wallpaper_path)
-                logger.info(f"Özel wallpaper silindi: {wallpaper_id}")
+            if wallpaper_path.is_dir():
+                self._remove_tree(wallpaper_path)
+                logger.info("Özel wallpaper silindi: %s", wallpaper_id)
                 return True
             else:
-                logger.warning(f"Wallpaper klasörü bulunamadı: {wallpaper_path}")
+                logger.warning("Wallpaper klasörü bulunamadı: %s", wallpaper_path)
                 return False
                 
         except Exception as e:
-            logger.error(f"Wallpaper silme hatası: {e}")
+            logger.error("Wallpaper silme hatası: %s", e)
             return False
     
+    def _remove_tree(self, path: Path) -> None:
+        """
+        Klasörü içeriğiyle birlikte siler.
+        
+        Büyük Workshop klasörleri için önce rm -rf denenir (unlinkat tabanlı,
+        dosya başına Python çağrısı yok); başarısız olursa shutil.rmtree kullanılır.
+        """
+        if self._have('rm'):
+            try:
+                subprocess.run(['rm', '-rf', '--', os.fspath(path)], check=True, timeout=60,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                return
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning("rm -rf başarısız, shutil.rmtree deneniyor: %s", e)
+        shutil.rmtree(path)
+    
     def stop_video_wallpaper(self, screen: str = "all") -> bool:
         """
         Video wallpaper process'lerini durdurur.
@@ -792,71 +993,155 @@ class WallpaperController:
             stopped_count = 0
             
             if screen == "all":
-                # Tüm video process'leri durdur
-                for screen_name in list(self.video_processes.keys()):
-                    if self._stop_video_process(screen_name):
-                        stopped_count += 1
+                # Tüm video process'leri birlikte durdur (bekleme süreleri örtüşür)
+                with self._video_lock:
+                    entries = list(self.video_processes.items())
+                stopped_count = self._stop_video_processes(entries)
             else:
                 # Belirli ekran için durdur
                 if self._stop_video_process(screen):
                     stopped_count += 1
             
-            # MPV wallpaper process'lerini de durdur
-            try:
-                result = subprocess.run(['pkill', '-f', 'mpv.*wallpaper'],
-                                      capture_output=True, timeout=5)
-                if result.returncode == 0:
+            # Takip edilen process yoksa eski MPV wallpaper process'lerini bul ve durdur
+            if not stopped_count:
+                procs = self._find_mpv_wallpaper_procs()
+                for proc in procs:
+                    try:
+                        proc.terminate()
+                    except psutil.Error:
+                        pass
+                if procs:
+                    _, alive = psutil.wait_procs(procs, timeout=3)
+                    for proc in alive:
+                        try:
+                            proc.kill()
+                        except psutil.Error:
+                            pass
                     stopped_count += 1
                     logger.info("MPV wallpaper process'leri durduruldu")
-            except:
-                pass
             
             if stopped_count > 0:
-                logger.info(f"{stopped_count} video wallpaper process'i durduruldu")
+                logger.info("%s video wallpaper process'i durduruldu", stopped_count)
                 return True
             else:
                 logger.info("Durdurulacak video wallpaper process'i bulunamadı")
                 return False
                 
         except Exception as e:
-            logger.error(f"Video wallpaper durdurma hatası: {e}")
+            logger.error("Video wallpaper durdurma hatası: %s", e)
             return False
     
+    def _find_mpv_wallpaper_procs(self) -> list:
+        """
+        Takip edilmeyen (ör. önceki oturumdan kalan) MPV wallpaper process'lerini bulur.
+        
+        Returns:
+            list: Eşleşen psutil.Process nesneleri
+        """
+        procs = []
+        for proc in psutil.process_iter(['name', 'cmdline']):
+            try:
+                name = (proc.info.get('name') or '').lower()
+                if 'mpv' not in name:
+                    continue
+                if any('wallpaper' in arg for arg in proc.info.get('cmdline') or ()):
+                    procs.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        return procs
+    
     def _stop_video_process(self, screen: str) -> bool:
         """Belirli ekran için video process'ini durdurur."""
-        try:
-            if screen not in self.video_processes:
-                return False
-            
-            process_info = self.video_processes[screen]
-            process = process_info.get('process')
+        with self._video_lock:
+            process_info = self.video_processes.get(screen)
+        if process_info is None:
+            return False
+        return self._stop_video_processes([(screen, process_info)]) > 0
+    
+    def _stop_video_processes(self, entries, timeout: float = 3) -> int:
+        """
+        Verilen video process'lerini durdurur.
+        
+        Önce hepsine SIGTERM gönderilir, ardından tek bir selector üzerinden
+        pidfd'leri birlikte beklenir; süre dolunca kalanlar SIGKILL ile öldürülür.
+        
+        Args:
+            entries: (screen, process_info) çiftleri
+            timeout: SIGTERM sonrası toplam bekleme süresi (saniye)
             
-            if process and process.poll() is None:  # Process hala çalışıyor
-                try:
-                    # Önce SIGTERM gönder
-                    process.terminate()
-                    
-                    # 3 saniye bekle
+        Returns:
+            int: Durdurulan (kaydı temizlenen) process sayısı
+        """
+        stopped = []
+        waiting = []  # pidfd alınamayan process'ler
+        selector = selectors.DefaultSelector()
+        try:
+            # Önce hepsinin process grubuna SIGTERM gönder
+            for screen, process_info in entries:
+                process = process_info.get('process')
+                if process and process.poll() is None:  # Process hala çalışıyor
                     try:
-                        process.wait(timeout=3)
-                    except subprocess.TimeoutExpired:
-                        # Zorla öldür
-                        process.kill()
-                        process.wait()
-                    
-                    logger.info(f"Video process durduruldu: {screen}")
-                    
-                except Exception as e:
-                    logger.error(f"Process durdurma hatası: {e}")
-                    return False
-            
-            # Process bilgisini temizle
-            del self.video_processes[screen]
-            return True
-            
-        except Exception as e:
-            logger.error(f"Video process durdurma hatası: {e}")
-            return False
+                        os.killpg(process_info.get('pgid', process.pid), signal.SIGTERM)
+                    except Exception as e:
+                        logger.error("Process durdurma hatası: %s", e)
+                        continue
+                    try:
+                        pidfd = os.pidfd_open(process.pid)
+                    except (AttributeError, OSError):
+                        waiting.append((screen, process_info))
+                    else:
+                        try:
+                            selector.register(pidfd, selectors.EVENT_READ, (screen, process_info))
+                        except (ValueError, KeyError, OSError):
+                            # Kayıt başarısızsa pidfd sızmasın, Popen ile bekle
+                            os.close(pidfd)
+                            waiting.append((screen, process_info))
+                stopped.append((screen, process_info))
+            
+            # Tüm process'leri aynı süre içinde bekle
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+                    key.data[1]['process'].wait()  # Process çıktı, sadece topla
+            
+            # Zaman aşımına uğrayanlar ve pidfd'siz olanlar
+            stragglers = waiting + [key.data for key in selector.get_map().values()]
+            for screen, process_info in stragglers:
+                process = process_info['process']
+                if not _wait_process(process, max(0.0, deadline - time.monotonic())):
+                    # Zorla öldür
+                    try:
+                        os.killpg(process_info.get('pgid', process.pid), signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    _wait_process(process, None)
+        finally:
+            # Hata durumunda da kayıtlı kalan tüm pidfd'leri kapat
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fd)
+                os.close(key.fd)
+            selector.close()
+        
+        # Process bilgilerini temizle
+        for screen, process_info in stopped:
+            process = process_info.get('process')
+            if process:
+                self._managed_procs.discard(process)
+                logger.info("Video process durduruldu: %s", screen)
+        if stopped:
+            # Bu arada yenisiyle değiştirilmemiş kayıtları çıkararak sözlüğü yeniden kur
+            stopped_ids = {id(process_info) for _, process_info in stopped}
+            with self._video_lock:
+                self.video_processes = {
+                    screen: info for screen, info in self.video_processes.items()
+                    if id(info) not in stopped_ids
+                }
+        return len(stopped)
     
     def get_video_wallpaper_status(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -868,7 +1153,10 @@ class WallpaperController:
         try:
             status = {}
             
-            for screen, process_info in self.video_processes.items():
+            with self._video_lock:
+                entries = list(self.video_processes.items())
+            
+            for screen, process_info in entries:
                 process = process_info.get('process')
                 file_path = process_info.get('file_path', 'Unknown')
                 
@@ -881,7 +1169,8 @@ class WallpaperController:
                         'method': process_info.get('method', 'unknown')
                     }
                 else:
-                    # Process durmuş
+                    # Process durmuş; poll() onu topladığı için takipten çıkar
+                    self._managed_procs.discard(process)
                     status[screen] = {
                         'status': 'stopped',
                         'file_path': file_path,
@@ -892,7 +1181,7 @@ class WallpaperController:
             return status
             
         except Exception as e:
-            logger.error(f"Video wallpaper durum kontrolü hatası: {e}")
+            logger.error("Video wallpaper durum kontrolü hatası: %s", e)
             return {}
     
     def cleanup_dead_processes(self) -> int:
@@ -903,47 +1192,45 @@ class WallpaperController:
             int: Temizlenen process sayısı
         """
         try:
-            cleaned_count = 0
-            dead_screens = []
-            
-            for screen, process_info in self.video_processes.items():
-                process = process_info.get('process')
-                
-                if process and process.poll() is not None:  # Process ölmüş
-                    dead_screens.append(screen)
-                    cleaned_count += 1
-            
-            # Ölü process'leri temizle
+            with self._video_lock:
+                processes = self.video_processes
+                # Sadece çalışan (veya process'i olmayan) kayıtları tut
+                live = {
+                    screen: info for screen, info in processes.items()
+                    if not info.get('process') or not _reap_if_dead(info['process'])
+                }
+                dead_screens = processes.keys() - live.keys()
+                dead_procs = [processes[screen]['process'] for screen in dead_screens]
+                self.video_processes = live
+            
+            self._managed_procs.difference_update(dead_procs)
             for screen in dead_screens:
-                del self.video_processes[screen]
-                logger.info(f"Ölü video process temizlendi: {screen}")
+                logger.info("Ölü video process temizlendi: %s", screen)
             
-            return cleaned_count
+            return len(dead_screens)
             
         except Exception as e:
-            logger.error(f"Ölü process temizleme hatası: {e}")
+            logger.error("Ölü process temizleme hatası: %s", e)
             return 0
     
     def _apply_sixel_wallpaper(self, media_file: Path, screen: str) -> bool:
         """Sixel ile wallpaper uygular - platform bağımsız çözüm."""
         try:
-            from utils.ffmpeg_utils import apply_sixel_wallpaper, is_sixel_available
-            
             # Sixel desteği kontrol et
-            if not is_sixel_available():
+            if apply_sixel_wallpaper is None or not is_sixel_available():
                 logger.warning("Sixel desteği mevcut değil")
                 return False
             
-            logger.info(f"Sixel ile wallpaper uygulanıyor: {media_file.name}")
+            logger.info("Sixel ile wallpaper uygulanıyor: %s", media_file.name)
             success = apply_sixel_wallpaper(media_file, screen)
             
             if success:
-                logger.info(f"Sixel wallpaper başarıyla uygulandı: {media_file.name}")
+                logger.info("Sixel wallpaper başarıyla uygulandı: %s", media_file.name)
                 return True
             else:
-                logger.error(f"Sixel wallpaper uygulanamadı: {media_file.name}")
+                logger.error("Sixel wallpaper uygulanamadı: %s", media_file.name)
                 return False
                 
         except Exception as e:
-            logger.error(f"Sixel wallpaper uygulama hatası: {e}")
+            logger.error("Sixel wallpaper uygulama hatası: %s", e)
             return False
\ No newline at end of file
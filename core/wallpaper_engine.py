@@ -1,12 +1,18 @@
 """
 Wallpaper Engine işlemlerini yöneten sınıf
 """
+import atexit
 import subprocess
 import logging
 import json
+import os
+import threading
+import time
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+import psutil
+
 from utils import (
     WALLPAPER_ENGINE_BINARY,
     kill_existing_wallpapers,
@@ -17,6 +23,13 @@ from utils import (
 
 logger = logging.getLogger(__name__)
 
+# Wallpaper state'i ayrı küçük bir dosyada tutulur (settings.json'u her seferinde okuyup yazmamak için)
+STATE_FILE = SETTINGS_FILE.with_suffix('.state.json')
+# Başlatılan linux-wallpaperengine process'inin PID kaydı (açılışta tam process taramasını önler)
+PID_FILE = SETTINGS_FILE.parent / 'we.pid.json'
+# Ardışık apply/restart çağrılarının tek kayda birleştirileceği süre (saniye)
+SAVE_DEBOUNCE_SECONDS = 0.25
+
 
 class WallpaperEngine:
     """
@@ -32,6 +45,24 @@ class WallpaperEngine:
         self.current_wallpaper: Optional[str] = None
         self.current_process: Optional[subprocess.Popen] = None
         self.last_settings: Dict[str, Any] = {}
+        self._binary_str = str(WALLPAPER_ENGINE_BINARY)
+        
+        # Bu oturumda başlatılan son process'in PID'i, wallpaper'ı ve ayarları
+        self._spawned_pid: Optional[int] = None
+        self._spawned_wallpaper: Optional[str] = None
+        self._spawned_settings: Optional[Dict[str, Any]] = None
+        
+        # State kaydı durumu
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._last_state_payload: Optional[str] = None  # Son yazılan içerik (değişmemişse yazma atlanır)
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush_state)
+        
+        # Arka plan process taraması durumu
+        self._state_lock = threading.Lock()
+        self._state_generation = 0  # apply_wallpaper her çağrıldığında artar
+        self._detect_thread: Optional[threading.Thread] = None
         
         # State'i restore et ve live detection
         self._load_state()
@@ -71,6 +102,36 @@ class WallpaperEngine:
         if not WALLPAPER_ENGINE_BINARY.exists():
             logger.error(f"Wallpaper Engine binary bulunamadı: {WALLPAPER_ENGINE_BINARY}")
             return False
+        
+        # Ayarları bir kez doğrula/sınırla, komut ve state aynı değerleri kullansın
+        try:
+            validated = self.validate_settings(
+                volume=volume,
+                fps=fps,
+                noautomute=noautomute,
+                no_audio_processing=no_audio_processing,
+                disable_mouse=disable_mouse
+            )
+        except (TypeError, ValueError) as e:
+            logger.error(f"Wallpaper uygularken hata: geçersiz ayar ({e})")
+            return False
+        new_settings = {
+            "screen": screen,
+            "volume": validated["volume"],
+            "fps": validated["fps"],
+            "noautomute": validated["noautomute"],
+            "no_audio_processing": validated["no_audio_processing"],
+            "disable_mouse": validated["disable_mouse"]
+        }
+        
+        # Aynı wallpaper aynı ayarlarla zaten çalışıyorsa yeniden başlatma
+        # (last_settings restart'sız güncellenebildiği için process'in başlatıldığı ayarlarla karşılaştır).
+        # Yalnızca o ayarlarla başlattığımız process'in kendisi canlıysa atlanır; çökmüş
+        # (zombie) bir process veya aynı wallpaper'ı gösteren başka bir process yeterli değildir.
+        if (wallpaper_id == self._spawned_wallpaper and new_settings == self._spawned_settings
+                and self._pid_is_wallpaper_engine(self._spawned_pid)):
+            logger.info(f"Wallpaper zaten aynı ayarlarla çalışıyor: {wallpaper_id}")
+            return True
 
         try:
             # Mevcut wallpaper'ları sonlandır - SADECE sistem genelinde olanları
@@ -78,53 +139,52 @@ class WallpaperEngine:
             
             # Komut oluştur
             cmd = [
-                str(WALLPAPER_ENGINE_BINARY),
+                self._binary_str,
                 "--screen-root", screen,
                 "--bg", wallpaper_id,
-                "--volume", str(max(0, min(100, volume))),
-                "--fps", str(max(10, min(144, fps)))
+                "--volume", str(new_settings["volume"]),
+                "--fps", str(new_settings["fps"])
             ]
             
             # Opsiyonel parametreler
-            if noautomute:
+            if new_settings["noautomute"]:
                 cmd.append("--noautomute")
-            if no_audio_processing:
+            if new_settings["no_audio_processing"]:
                 cmd.append("--no-audio-processing")
-            if disable_mouse:
+            if new_settings["disable_mouse"]:
                 cmd.append("--disable-mouse")
                 
             logger.info(f"Wallpaper uygulanıyor: {wallpaper_id}")
-            logger.debug(f"Komut: {' '.join(cmd)}")
+            logger.debug("Komut: %s", cmd)
             
             # Süreci tamamen bağımsız olarak başlat (detached process)
             self.current_process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                start_new_session=True,
-                preexec_fn=None if hasattr(subprocess, 'CREATE_NEW_PROCESS_GROUP') else lambda: None
+                start_new_session=True  # setsid() C tarafında yapılır, preexec_fn gerekmez
             )
             
             # Process referansını hemen temizle - wallpaper bağımsız çalışsın
+            # (nesne yok edilirken de süreç sonlandırılmaz; __del__ gerekmez)
             process_pid = self.current_process.pid
             self.current_process = None
             logger.info(f"Wallpaper bağımsız süreç olarak başlatıldı (PID: {process_pid})")
+            self._write_pid_file(process_pid, wallpaper_id)
             
             # Ayarları kaydet
-            self.current_wallpaper = wallpaper_id
-            self.last_settings = {
-                "screen": screen,
-                "volume": volume,
-                "fps": fps,
-                "noautomute": noautomute,
-                "no_audio_processing": no_audio_processing,
-                "disable_mouse": disable_mouse
-            }
+            with self._state_lock:
+                self._state_generation += 1
+                self.current_wallpaper = wallpaper_id
+            self.last_settings = new_settings
+            self._spawned_pid = process_pid
+            self._spawned_wallpaper = wallpaper_id
+            self._spawned_settings = dict(new_settings)
             
             logger.info(f"Wallpaper başarıyla uygulandı: {wallpaper_id}")
             
-            # State'i kaydet
-            self._save_state()
+            # State'i kaydet (ardışık restart'lar tek yazıma birleşir)
+            self._schedule_save()
             return True
             
         except FileNotFoundError:
@@ -251,59 +311,95 @@ class WallpaperEngine:
     def _load_state(self) -> None:
         """App restart sonrası state'i restore eder."""
         try:
-            print(f"[DEBUG] WallpaperEngine._load_state() çağrıldı")
-            print(f"[DEBUG] Settings dosyası: {SETTINGS_FILE}")
-            print(f"[DEBUG] Dosya var mı? {SETTINGS_FILE.exists()}")
+            logger.debug("State dosyası: %s", STATE_FILE)
             
-            if SETTINGS_FILE.exists():
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                print(f"[DEBUG] Settings data keys: {list(data.keys())}")
-                
-                # Wallpaper state'ini restore et
-                wallpaper_state = data.get('wallpaper_state', {})
-                print(f"[DEBUG] Wallpaper state: {wallpaper_state}")
+            wallpaper_state = self._read_state()
+            if wallpaper_state is not None:
+                logger.debug("Wallpaper state: %s", wallpaper_state)
                 
                 self.current_wallpaper = wallpaper_state.get('current_wallpaper')
                 self.last_settings = wallpaper_state.get('last_settings', {})
                 
-                print(f"[DEBUG] Restore edilen current_wallpaper: {self.current_wallpaper}")
-                print(f"[DEBUG] Restore edilen last_settings: {self.last_settings}")
-                
                 if self.current_wallpaper:
                     logger.info(f"State restore edildi: {self.current_wallpaper}")
-                    print(f"[DEBUG] ✅ State başarıyla restore edildi: {self.current_wallpaper}")
                 else:
-                    print(f"[DEBUG] ❌ Current wallpaper restore edilemedi")
+                    logger.debug("Current wallpaper restore edilemedi")
             else:
-                print(f"[DEBUG] ❌ Settings dosyası bulunamadı")
+                logger.debug("State dosyası bulunamadı")
                     
         except Exception as e:
-            logger.error(f"State restore hatası: {e}")
-            print(f"[DEBUG] ❌ State restore hatası: {e}")
-            import traceback
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+            logger.error(f"State restore hatası: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+    
+    def _read_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Kayıtlı wallpaper state'ini okur.
+        
+        Önce ayrı state dosyasına bakar; yoksa eski sürümlerin settings.json
+        içindeki 'wallpaper_state' anahtarına düşer.
+        
+        Returns:
+            dict: Wallpaper state'i veya bulunamazsa None
+        """
+        if STATE_FILE.exists():
+            with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        if SETTINGS_FILE.exists():
+            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f).get('wallpaper_state')
+        return None
+    
+    def _schedule_save(self) -> None:
+        """State kaydını kısa bir gecikmeyle planlar; bekleyen kayıt varsa onu erteler."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush_state)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush_state(self) -> None:
+        """Bekleyen state kaydı varsa hemen diske yazar."""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+        self._save_state()
     
     def _save_state(self) -> None:
-        """Current state'i settings dosyasına kaydet."""
+        """Current state'i state dosyasına kaydet."""
+        with self._write_lock:
+            self._write_state()
+    
+    def _write_state(self) -> None:
+        """State dosyasını yazar (_write_lock altında çağrılır)."""
         try:
-            # Mevcut settings'i oku
-            data = {}
-            if SETTINGS_FILE.exists():
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            
-            # Wallpaper state'ini ekle
-            data['wallpaper_state'] = {
+            payload = json.dumps({
                 'current_wallpaper': self.current_wallpaper,
                 'last_settings': self.last_settings
-            }
+            }, ensure_ascii=False, separators=(',', ':'))
+            
+            # İçerik değişmediyse diske dokunma
+            if payload == self._last_state_payload:
+                return
+            
+            # Geçici dosyaya yaz, diske indir, sonra atomik olarak değiştir
+            # (yarıda kalan yazım state'i bozup açılışta tam taramaya yol açmasın)
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = STATE_FILE.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, STATE_FILE)
             
-            # Geri kaydet
-            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Yeniden adlandırmanın kalıcı olması için dizini de senkronize et
+            dir_fd = os.open(STATE_FILE.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+            self._last_state_payload = payload
                 
             logger.debug(f"Wallpaper state kaydedildi: {self.current_wallpaper}")
             
@@ -311,63 +407,211 @@ class WallpaperEngine:
             logger.error(f"State kaydetme hatası: {e}")
 
     def _detect_running_wallpaper(self) -> None:
-        """Çalışan wallpaper'ı live olarak detect eder."""
+        """
+        Çalışan wallpaper'ı live olarak detect eder.
+        
+        PID kaydı varsa kontrol anında yapılır; kayıt yoksa veya kayıtlı
+        process çalışmıyorsa tam process taraması açılışı bekletmemek için
+        arka plan thread'inde çalışır.
+        """
         try:
-            print(f"[DEBUG] _detect_running_wallpaper() başladı")
+            # Bu uygulamanın başlattığı process kayıtlıysa önce onu kontrol et
+            pid_info = self._read_pid_file()
+            if pid_info is not None:
+                pid = pid_info.get('pid')
+                detected_id = pid_info.get('wallpaper_id')
+                if detected_id and self._pid_is_wallpaper_engine(pid):
+                    self.current_wallpaper = detected_id
+                    self._schedule_save()
+                    logger.info(f"Live wallpaper detection (PID kaydı): {detected_id}")
+                    return
+                
+                # Eski kayıt: sil ve başka yolla başlatılmış engine için taramaya düş
+                logger.debug("Kayıtlı wallpaper process'i çalışmıyor (PID: %s)", pid)
+                try:
+                    PID_FILE.unlink()
+                except FileNotFoundError:
+                    pass
+            
+            self._detect_thread = threading.Thread(
+                target=self._scan_running_wallpaper,
+                args=(self._state_generation,),
+                name="wallpaper-detect",
+                daemon=True
+            )
+            self._detect_thread.start()
+                
+        except Exception as e:
+            logger.error(f"Wallpaper detection hatası: {e}")
+    
+    def wait_for_detect(self, timeout: Optional[float] = 0.1) -> bool:
+        """
+        Arka plandaki wallpaper taramasının bitmesini bekler.
+        
+        Args:
+            timeout: Azami bekleme süresi (saniye)
             
-            import psutil
+        Returns:
+            bool: Tarama bittiyse (veya hiç başlatılmadıysa) True
+        """
+        thread = self._detect_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+    
+    def _scan_running_wallpaper(self, generation: int) -> None:
+        """
+        Tüm process'leri tarayarak çalışan wallpaper'ı bulur.
+        
+        Args:
+            generation: Tarama başladığındaki state nesli; bu arada yeni bir
+                wallpaper uygulandıysa sonuç yok sayılır
+        """
+        try:
             detected_wallpaper = None
             
             # Tüm linux-wallpaperengine process'lerini bul
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    proc_info = proc.info
-                    proc_name = proc_info.get('name', '')
-                    cmdline = proc_info.get('cmdline', [])
+            for pid, proc_name, cmdline in self._iter_wallpaper_processes():
+                # linux-wallpaperengine process'i mi?
+                if 'wallpaperengine' in proc_name.lower() or 'wallpaper-engine' in proc_name.lower():
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Wallpaper process bulundu: PID={pid}, name={proc_name}, cmdline={cmdline}")
                     
-                    # linux-wallpaperengine process'i mi?
-                    if 'wallpaperengine' in proc_name.lower() or 'wallpaper-engine' in proc_name.lower():
-                        print(f"[DEBUG] Wallpaper process bulundu: PID={proc_info['pid']}, name={proc_name}")
-                        print(f"[DEBUG] Command line: {cmdline}")
-                        
-                        # Command line'dan --bg parametresini bul
-                        if cmdline and '--bg' in cmdline:
-                            try:
-                                bg_index = cmdline.index('--bg')
-                                if bg_index + 1 < len(cmdline):
-                                    detected_wallpaper = cmdline[bg_index + 1]
-                                    print(f"[DEBUG] ✅ Çalışan wallpaper detect edildi: {detected_wallpaper}")
-                                    break
-                            except (ValueError, IndexError):
-                                continue
-                                
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+                    # Command line'dan --bg parametresini bul
+                    try:
+                        bg_index = cmdline.index('--bg')
+                    except ValueError:
+                        continue
+                    if bg_index + 1 < len(cmdline):
+                        detected_wallpaper = cmdline[bg_index + 1]
+                        logger.debug("Çalışan wallpaper detect edildi: %s", detected_wallpaper)
+                        break
             
             if detected_wallpaper:
                 # Dosya yolunu folder ID'ye çevir
                 detected_id = self._extract_folder_id_from_path(detected_wallpaper)
                 if detected_id:
-                    print(f"[DEBUG] ✅ Live detection: {detected_id}")
-                    self.current_wallpaper = detected_id
+                    with self._state_lock:
+                        if generation != self._state_generation:
+                            logger.debug("Tarama sırasında yeni wallpaper uygulandı, sonuç atlandı")
+                            return
+                        self.current_wallpaper = detected_id
                     # State'i güncelle
                     self._save_state()
                     logger.info(f"Live wallpaper detection: {detected_id}")
                 else:
-                    print(f"[DEBUG] ❌ Folder ID çıkarılamadı: {detected_wallpaper}")
+                    logger.debug("Folder ID çıkarılamadı: %s", detected_wallpaper)
             else:
-                print(f"[DEBUG] ❌ Çalışan wallpaper bulunamadı")
+                logger.debug("Çalışan wallpaper bulunamadı")
                 
         except Exception as e:
             logger.error(f"Wallpaper detection hatası: {e}")
-            print(f"[DEBUG] ❌ Wallpaper detection hatası: {e}")
+    
+    def _write_pid_file(self, pid: int, wallpaper_id: str) -> None:
+        """Başlatılan process'in PID'ini ve wallpaper ID'sini kaydeder."""
+        try:
+            PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = PID_FILE.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'pid': pid, 'wallpaper_id': wallpaper_id, 'started_at': time.time()}, f)
+            os.replace(tmp_file, PID_FILE)
+        except OSError as e:
+            logger.error(f"PID kaydı yazılamadı: {e}")
+    
+    def _read_pid_file(self) -> Optional[Dict[str, Any]]:
+        """
+        PID kaydını okur.
+        
+        Returns:
+            dict: {'pid', 'wallpaper_id', 'started_at'} veya kayıt yoksa/bozuksa None
+        """
+        try:
+            with open(PID_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except (OSError, ValueError):
+            return None
+    
+    def _pid_is_wallpaper_engine(self, pid: Any) -> bool:
+        """
+        PID'in hâlâ çalışan bir linux-wallpaperengine process'ine ait olup olmadığını kontrol eder.
+        
+        PID yeniden kullanımına karşı process adı da doğrulanır; çökmüş ama
+        henüz toplanmamış (zombie) process'ler ölü sayılır.
+        """
+        if not isinstance(pid, int) or pid <= 0:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass  # Process var ama başka kullanıcıya ait olabilir, stat ile doğrula
+        try:
+            with open(f'/proc/{pid}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            if os.path.isdir('/proc'):
+                return False
+            # /proc yoksa (Linux dışı) durumu psutil ile kontrol et
+            try:
+                return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return False
+        # Biçim: "pid (comm) durum ..."; comm parantez içerebildiği için son ')' aranır
+        comm_end = stat.rfind(b')')
+        if stat[comm_end + 2:comm_end + 3] in (b'Z', b'X'):
+            return False
+        return b'wallpaper' in stat[stat.find(b'(') + 1:comm_end].lower()
+    
+    def _iter_wallpaper_processes(self):
+        """
+        Adında "wallpaper" geçen process'leri (pid, name, cmdline) olarak üretir.
+        
+        Linux'ta önce kısa /proc/<pid>/comm okunur, cmdline yalnızca aday
+        process'ler için okunur. /proc yoksa psutil taramasına düşülür.
+        """
+        if not os.path.isdir('/proc'):
+            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                try:
+                    proc_info = proc.info
+                    yield proc_info['pid'], proc_info.get('name') or '', proc_info.get('cmdline') or []
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+            return
+        
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/comm', 'rb') as f:
+                    comm = f.read().decode('utf-8', 'replace').strip()
+                # comm 15 karakterle sınırlı ("linux-wallpaper"), geniş ön filtre
+                if 'wallpaper' not in comm.lower():
+                    continue
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                continue
+            
+            cmdline = raw.decode('utf-8', 'replace').split('\x00')
+            if cmdline and not cmdline[-1]:
+                cmdline.pop()
+            
+            # Kesilmiş comm yerine tam binary adını kullan (psutil'in name() davranışı)
+            name = comm
+            if len(comm) >= 15 and cmdline:
+                full_name = os.path.basename(cmdline[0])
+                if full_name.startswith(comm):
+                    name = full_name
+            yield int(entry), name, cmdline
     
     def _extract_folder_id_from_path(self, wallpaper_path: str) -> Optional[str]:
         """Wallpaper path'inden folder ID'sini çıkarır."""
         try:
             # Örnek path: /home/user/.steam/steam/steamapps/workshop/content/431960/123456789
             # Folder ID: 123456789
-            from pathlib import Path
             path_obj = Path(wallpaper_path)
             
             # Steam workshop path kontrolü
@@ -377,14 +621,14 @@ class WallpaperEngine:
                 for i, part in enumerate(parts):
                     if part == "431960" and i + 1 < len(parts):
                         folder_id = parts[i + 1]
-                        print(f"[DEBUG] Steam workshop folder ID: {folder_id}")
+                        logger.debug("Steam workshop folder ID: %s", folder_id)
                         return folder_id
             
             # Yerel wallpaper path'i de kontrol edebiliriz
             # /path/to/wallpapers/folder_name gibi
             folder_name = path_obj.name
             if folder_name and folder_name != "." and folder_name != "..":
-                print(f"[DEBUG] Local wallpaper folder: {folder_name}")
+                logger.debug("Local wallpaper folder: %s", folder_name)
                 return folder_name
                 
             return None
@@ -392,11 +636,3 @@ class WallpaperEngine:
         except Exception as e:
             logger.error(f"Path'den folder ID çıkarma hatası: {e}")
             return None
-
-    def __del__(self):
-        """Destructor - hiçbir şey yapma, wallpaper bağımsız çalışsın"""
-        try:
-            # Hiçbir şey yapma - wallpaper tamamen bağımsız
-            pass
-        except Exception:
-            pass  # Destructor'da hata fırlatmayalım
\ No newline at end of file
@@ -3,14 +3,62 @@ Core Engine Management - Template-based Refactored Version
 Wallpaper engine core functionality with clear flow organization
 """
 
+import atexit
+import functools
+import itertools
 import logging
+import os
 import subprocess
 import json
 import random
-from typing import Optional, List, Dict, Any
+import select
+import shutil
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Set, Deque, Mapping, Tuple
 from pathlib import Path
 
-from utils import validate_wallpaper_path, kill_existing_wallpapers, WALLPAPER_ENGINE_BINARY
+# Use orjson's C serializer when installed, stdlib json otherwise
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError).
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
+try:
+    import psutil
+except ImportError:  # Optional: process inspection helpers degrade gracefully
+    psutil = None
+
+from utils import (
+    validate_wallpaper_path, kill_existing_wallpapers, WALLPAPER_ENGINE_BINARY, STEAM_WORKSHOP_PATH
+)
+
+_log = logging.getLogger(__name__)
+
+# Workshop root as a Path, built once for wallpaper path resolution
+_WORKSHOP = Path(STEAM_WORKSHOP_PATH)
+
+# Validation results are reused for this many seconds
+_VALIDATE_TTL = 60
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_cached(_wallpaper_id: str, _ttl_bucket: int) -> bool:
+    """Cached validate_wallpaper_path; ttl_bucket changes every _VALIDATE_TTL seconds"""
+    return validate_wallpaper_path(_wallpaper_id)
 
 
 class App:
@@ -33,6 +81,7 @@ class App:
         Flow.PlaylistManager.Load_Settings()
         Flow.PlaylistManager.Initialize_State()
         Flow.PlaylistManager.Setup_Persistence()
+        Flow.WallpaperEngine.Prewarm()
     
     @staticmethod
     def ControlWallpaper():
@@ -51,6 +100,13 @@ class Flow:
     class WallpaperEngine:
         """Wallpaper engine execution and management flow"""
         
+        # Boolean kwargs mapped to their command line flags
+        _FLAG_ARGS = (
+            ("noautomute", "--noautomute"),
+            ("no_audio_processing", "--no-audio-processing"),
+            ("disable_mouse", "--disable-mouse"),
+        )
+        
         @staticmethod
         def Validate_Wallpaper(_wallpaper_id: str) -> bool:
             """
@@ -58,16 +114,16 @@ class Flow:
             Checks file system paths and wallpaper integrity.
             """
             if not _wallpaper_id:
-                logging.error("Wallpaper ID is empty")
+                _log.error("Wallpaper ID is empty")
                 return False
             
-            _is_valid = validate_wallpaper_path(_wallpaper_id)
+            _is_valid = _validate_cached(_wallpaper_id, int(time.monotonic() // _VALIDATE_TTL))
             if not _is_valid:
-                logging.error(f"Invalid wallpaper: {_wallpaper_id}")
+                _log.error("Invalid wallpaper: %s", _wallpaper_id)
                 return False
             
             Alias.WallpaperState.validated_wallpaper = _wallpaper_id
-            logging.info(f"Wallpaper validated: {_wallpaper_id}")
+            _log.info("Wallpaper validated: %s", _wallpaper_id)
             return True
         
         @staticmethod
@@ -76,38 +132,24 @@ class Flow:
             Prepares wallpaper engine command with all parameters.
             Builds command line arguments based on user settings.
             """
-            _base_cmd = [WALLPAPER_ENGINE_BINARY]
-            
-            # Add wallpaper path
             _wallpaper_path = Bundle.PathResolver.get_wallpaper_path(_wallpaper_id)
-            _base_cmd.extend(["--dir", str(_wallpaper_path)])
-            
-            # Add screen parameter
-            _screen = _kwargs.get("screen", "eDP-1")
-            _base_cmd.extend(["--screen-root", _screen])
-            
-            # Add audio settings
-            _volume = _kwargs.get("volume", 50)
-            _base_cmd.extend(["--volume", str(_volume)])
-            
-            # Add FPS setting
-            _fps = _kwargs.get("fps", 60)
-            _base_cmd.extend(["--fps", str(_fps)])
-            
-            # Add boolean flags
-            if _kwargs.get("noautomute", False):
-                _base_cmd.append("--noautomute")
             
-            if _kwargs.get("no_audio_processing", False):
-                _base_cmd.append("--no-audio-processing")
-            
-            if _kwargs.get("disable_mouse", False):
-                _base_cmd.append("--disable-mouse")
+            # Path, screen, audio and FPS parameters followed by boolean flags
+            _base_cmd = [
+                os.fspath(WALLPAPER_ENGINE_BINARY),
+                "--dir", str(_wallpaper_path),
+                "--screen-root", _kwargs.get("screen", "eDP-1"),
+                "--volume", str(_kwargs.get("volume", 50)),
+                "--fps", str(_kwargs.get("fps", 60)),
+            ]
+            _base_cmd += [_flag for _key, _flag in Flow.WallpaperEngine._FLAG_ARGS if _kwargs.get(_key, False)]
             
             Alias.WallpaperState.prepared_command = _base_cmd
-            Alias.WallpaperState.command_kwargs = _kwargs.copy()
+            # **_kwargs is already a fresh dict owned by this call; expose it read-only
+            Alias.WallpaperState.command_kwargs = MappingProxyType(_kwargs)
             
-            logging.info(f"Command prepared: {' '.join(_base_cmd)}")
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("Command prepared: %s", ' '.join(_base_cmd))
         
         @staticmethod
         def Execute_Wallpaper() -> bool:
@@ -115,33 +157,52 @@ class Flow:
             Executes wallpaper engine with prepared command.
             Handles process management and error handling.
             """
-            if not hasattr(Alias.WallpaperState, 'prepared_command'):
-                logging.error("No command prepared for execution")
+            if Alias.WallpaperState.prepared_command is None:
+                _log.error("No command prepared for execution")
                 return False
             
             try:
-                # Kill existing wallpaper processes
-                Flow.WallpaperEngine._Kill_Existing_Processes()
-                
-                # Start new wallpaper process
+                # Start new wallpaper process first; old ones are killed afterwards
                 _cmd = Alias.WallpaperState.prepared_command
-                _process = subprocess.Popen(
-                    _cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    start_new_session=True  # Detached process
-                )
+                with Alias.WallpaperState._spawn_lock:
+                    _process = Bundle.ProcessManager.spawn_detached(
+                        _cmd, Alias.WallpaperState.command_kwargs.get('capture_output', False)
+                    )
+                    
+                    Alias.WallpaperState.current_process = _process
+                    Alias.WallpaperState.process_pid = _process.pid
+                    Alias.WallpaperState._spawn_generation += 1
+                    _generation = Alias.WallpaperState._spawn_generation
+                Flow.WallpaperController._Start_Exit_Watcher(_process)
                 
-                Alias.WallpaperState.current_process = _process
-                Alias.WallpaperState.process_pid = _process.pid
+                # Kill existing wallpaper processes in the background, sparing the new one
+                threading.Thread(
+                    target=Flow.WallpaperEngine._Kill_Previous_Processes,
+                    args=(_generation,),
+                    name="wallpaper-kill-previous",
+                    daemon=True
+                ).start()
                 
-                logging.info(f"Wallpaper process started: PID {_process.pid}")
+                _log.info("Wallpaper process started: PID %s", _process.pid)
                 return True
                 
             except Exception as e:
-                logging.error(f"Failed to execute wallpaper: {e}")
+                _log.error("Failed to execute wallpaper: %s", e)
                 return False
         
+        @staticmethod
+        def Prewarm():
+            """
+            Prepares the engine binary for fast launches in the background.
+            Resolves its path once and preloads it into the page cache.
+            """
+            threading.Thread(
+                target=Bundle.ProcessManager.prewarm_executable,
+                args=(WALLPAPER_ENGINE_BINARY,),
+                name="wallpaper-prewarm",
+                daemon=True
+            ).start()
+        
         @staticmethod
         def Update_State(_wallpaper_id: str):
             """
@@ -153,38 +214,58 @@ class Flow:
             Alias.WallpaperState.last_applied_time = Bundle.TimeUtils.get_current_timestamp()
             
             # Store execution history
-            _execution_record = {
-                "wallpaper_id": _wallpaper_id,
-                "timestamp": Alias.WallpaperState.last_applied_time,
-                "command": Alias.WallpaperState.prepared_command,
-                "kwargs": Alias.WallpaperState.command_kwargs
-            }
+            _execution_record = ExecutionRecord(
+                _wallpaper_id,
+                Alias.WallpaperState.last_applied_time,
+                Alias.WallpaperState.prepared_command,
+                Alias.WallpaperState.command_kwargs
+            )
             
+            # Bounded deque keeps only the last 10 executions
             Collect.ExecutionHistory.recent_executions.append(_execution_record)
             
-            # Keep only last 10 executions
-            if len(Collect.ExecutionHistory.recent_executions) > 10:
-                Collect.ExecutionHistory.recent_executions.pop(0)
-            
-            logging.info(f"Wallpaper state updated: {_wallpaper_id}")
+            _log.info("Wallpaper state updated: %s", _wallpaper_id)
         
         @staticmethod
-        def _Kill_Existing_Processes():
-            """Kills existing wallpaper engine processes"""
+        def _Kill_Previous_Processes(_generation: int):
+            """
+            Kills wallpaper processes older than the current one.
+            Runs under the spawn lock and reads the current PID at kill time;
+            jobs from superseded launches are dropped (the newer job covers them).
+            """
+            with Alias.WallpaperState._spawn_lock:
+                if _generation != Alias.WallpaperState._spawn_generation:
+                    return
+                Flow.WallpaperEngine._Kill_Existing_Processes((Alias.WallpaperState.process_pid,))
+        
+        @staticmethod
+        def _Kill_Existing_Processes(_exclude_pids: Tuple[int, ...] = ()):
+            """Kills existing wallpaper engine processes except the given PIDs"""
             try:
-                _killed = kill_existing_wallpapers()
+                _killed = kill_existing_wallpapers(_exclude_pids)
                 if _killed:
-                    logging.info("Existing wallpaper processes terminated")
+                    _log.info("Existing wallpaper processes terminated")
+                    _current = Alias.WallpaperState.current_process
+                    if _current is not None and _current.pid in _exclude_pids:
+                        return  # Current process was spared; keep its state
                     # Reset state
                     Alias.WallpaperState.current_process = None
                     Alias.WallpaperState.process_pid = None
                     Alias.WallpaperState.is_running = False
             except Exception as e:
-                logging.warning(f"Failed to kill existing processes: {e}")
+                _log.warning("Failed to kill existing processes: %s", e)
     
     class PlaylistManager:
         """Playlist management and persistence flow"""
         
+        # Scalar PlaylistState fields stored under the same key, with defaults
+        _DEFAULT_SETTINGS = (
+            ('timer_interval', 30),
+            ('is_random', False),
+            ('is_playing', False),
+            ('current_index', 0),
+        )
+        
         @staticmethod
         def Load_Settings():
             """
@@ -195,29 +276,31 @@ class Flow:
             
             try:
                 if _settings_path.exists():
-                    with open(_settings_path, 'r', encoding='utf-8') as f:
-                        _data = json.load(f)
+                    _data = _loads(_settings_path.read_bytes())
+                    
+                    # Keep parsed settings in memory; later saves update this dict
+                    Alias.PlaylistState._settings_cache = _data
                     
                     # Load playlist settings
-                    Alias.PlaylistState.timer_interval = _data.get('timer_interval', 30)
-                    Alias.PlaylistState.is_random = _data.get('is_random', False)
-                    Alias.PlaylistState.is_playing = _data.get('is_playing', False)
-                    Alias.PlaylistState.current_index = _data.get('current_index', 0)
+                    for _key, _default in Flow.PlaylistManager._DEFAULT_SETTINGS:
+                        setattr(Alias.PlaylistState, _key, _data.get(_key, _default))
                     
                     # Load playlists
                     Collect.PlaylistData.saved_playlists = _data.get('playlists', {})
-                    Collect.PlaylistData.recent_wallpapers = _data.get('recent', [])
+                    Flow.PlaylistManager._Set_Recent(
+                        Flow.PlaylistManager._Intern_Ids(_data.get('recent', []))
+                    )
                     
                     # Load current playlist
-                    _current_playlist = _data.get('current_playlist', [])
-                    Alias.PlaylistState.current_playlist = _current_playlist
+                    _current_playlist = Flow.PlaylistManager._Intern_Ids(_data.get('current_playlist', []))
+                    Flow.PlaylistManager._Set_Current_Playlist(_current_playlist)
                     
-                    logging.info(f"Playlist settings loaded: {len(_current_playlist)} items")
+                    _log.info("Playlist settings loaded: %s items", len(_current_playlist))
                 else:
                     Flow.PlaylistManager._Initialize_Default_Settings()
                     
             except Exception as e:
-                logging.error(f"Failed to load playlist settings: {e}")
+                _log.error("Failed to load playlist settings: %s", e)
                 Flow.PlaylistManager._Initialize_Default_Settings()
         
         @staticmethod
@@ -233,9 +316,9 @@ class Flow:
             
             # Initialize runtime state
             Alias.PlaylistState.last_wallpaper = None
-            Alias.PlaylistState.shuffle_history = []
+            Alias.PlaylistState.shuffle_history = deque(maxlen=10)
             
-            logging.info("Playlist manager state initialized")
+            _log.info("Playlist manager state initialized")
         
         @staticmethod
         def Setup_Persistence():
@@ -243,9 +326,9 @@ class Flow:
             Sets up automatic persistence for playlist changes.
             Ensures settings are saved when modified.
             """
-            # This would be called whenever playlist state changes
-            # Implementation depends on UI framework integration
-            pass
+            # Pending debounced changes are written on interpreter exit
+            atexit.unregister(Flow.PlaylistManager._Flush_Settings)
+            atexit.register(Flow.PlaylistManager._Flush_Settings)
         
         @staticmethod
         def Add_To_Current_Playlist(_wallpaper_id: str) -> bool:
@@ -253,14 +336,16 @@ class Flow:
             Adds wallpaper to current playlist.
             Prevents duplicates and maintains playlist integrity.
             """
-            if _wallpaper_id in Alias.PlaylistState.current_playlist:
-                logging.debug(f"Wallpaper already in playlist: {_wallpaper_id}")
+            _wallpaper_id = Flow.PlaylistManager._Intern_Id(_wallpaper_id)
+            if _wallpaper_id in Alias.PlaylistState._current_playlist_set:
+                _log.debug("Wallpaper already in playlist: %s", _wallpaper_id)
                 return False
             
             Alias.PlaylistState.current_playlist.append(_wallpaper_id)
-            Flow.PlaylistManager._Save_Settings()
+            Alias.PlaylistState._current_playlist_set.add(_wallpaper_id)
+            Flow.PlaylistManager._Mark_Dirty()
             
-            logging.info(f"Added to playlist: {_wallpaper_id}")
+            _log.info("Added to playlist: %s", _wallpaper_id)
             return True
         
         @staticmethod
@@ -271,13 +356,14 @@ class Flow:
             """
             if 0 <= _index < len(Alias.PlaylistState.current_playlist):
                 _removed = Alias.PlaylistState.current_playlist.pop(_index)
+                Alias.PlaylistState._current_playlist_set.discard(_removed)
                 
                 # Adjust current index if necessary
                 if Alias.PlaylistState.current_index >= _index:
                     Alias.PlaylistState.current_index = max(0, Alias.PlaylistState.current_index - 1)
                 
-                Flow.PlaylistManager._Save_Settings()
-                logging.info(f"Removed from playlist: {_removed}")
+                Flow.PlaylistManager._Mark_Dirty()
+                _log.info("Removed from playlist: %s", _removed)
                 return _removed
             
             return None
@@ -293,6 +379,10 @@ class Flow:
             
             _playlist_length = len(Alias.PlaylistState.current_playlist)
             
+            # Single item: "next" is always the same, nothing to update or save
+            if _playlist_length == 1:
+                return Alias.PlaylistState.current_playlist[0]
+            
             if _is_random:
                 return Flow.PlaylistManager._Get_Random_Wallpaper()
             else:
@@ -308,9 +398,12 @@ class Flow:
                 return None
             
             _playlist_length = len(Alias.PlaylistState.current_playlist)
+            if _playlist_length == 1:
+                return Alias.PlaylistState.current_playlist[0]
+            
             Alias.PlaylistState.current_index = (Alias.PlaylistState.current_index - 1) % _playlist_length
             
-            Flow.PlaylistManager._Save_Settings()
+            Flow.PlaylistManager._Mark_Dirty()
             return Alias.PlaylistState.current_playlist[Alias.PlaylistState.current_index]
         
         @staticmethod
@@ -319,48 +412,84 @@ class Flow:
             Adds wallpaper to recent history.
             Maintains a limited history of recently played wallpapers.
             """
-            if _wallpaper_id in Collect.PlaylistData.recent_wallpapers:
-                Collect.PlaylistData.recent_wallpapers.remove(_wallpaper_id)
-            
-            Collect.PlaylistData.recent_wallpapers.insert(0, _wallpaper_id)
+            _wallpaper_id = Flow.PlaylistManager._Intern_Id(_wallpaper_id)
+            _recent = Collect.PlaylistData.recent_wallpapers
+            if _wallpaper_id in Collect.PlaylistData._recent_set:
+                _recent.remove(_wallpaper_id)
+            else:
+                # Keep only last 20 recent wallpapers: appendleft evicts the oldest
+                if len(_recent) == _recent.maxlen:
+                    Collect.PlaylistData._recent_set.discard(_recent[-1])
+                Collect.PlaylistData._recent_set.add(_wallpaper_id)
             
-            # Keep only last 20 recent wallpapers
-            if len(Collect.PlaylistData.recent_wallpapers) > 20:
-                Collect.PlaylistData.recent_wallpapers = Collect.PlaylistData.recent_wallpapers[:20]
+            _recent.appendleft(_wallpaper_id)
             
-            Flow.PlaylistManager._Save_Settings()
+            Flow.PlaylistManager._Mark_Dirty()
         
         @staticmethod
         def _Initialize_Default_Settings():
             """Initializes default playlist settings"""
-            Alias.PlaylistState.timer_interval = 30
-            Alias.PlaylistState.is_random = False
-            Alias.PlaylistState.is_playing = False
-            Alias.PlaylistState.current_index = 0
-            Alias.PlaylistState.current_playlist = []
+            for _key, _default in Flow.PlaylistManager._DEFAULT_SETTINGS:
+                setattr(Alias.PlaylistState, _key, _default)
+            Flow.PlaylistManager._Set_Current_Playlist([])
             Collect.PlaylistData.saved_playlists = {}
-            Collect.PlaylistData.recent_wallpapers = []
+            Flow.PlaylistManager._Set_Recent([])
+            Alias.PlaylistState._settings_cache = {}
             
-            logging.info("Default playlist settings initialized")
+            _log.info("Default playlist settings initialized")
+        
+        @staticmethod
+        def _Intern_Id(_id: str) -> str:
+            """Interns a wallpaper ID; non-str values are returned unchanged"""
+            return sys.intern(_id) if type(_id) is str else _id
+        
+        @staticmethod
+        def _Intern_Ids(_ids: List[str]) -> List[str]:
+            """Interns wallpaper IDs so list, set and history share one object per ID"""
+            _intern = Flow.PlaylistManager._Intern_Id
+            return [_intern(_id) for _id in _ids]
+        
+        @staticmethod
+        def _Set_Current_Playlist(_playlist: List[str]):
+            """Replaces current playlist and rebuilds its lookup set"""
+            Alias.PlaylistState.current_playlist = _playlist
+            Alias.PlaylistState._current_playlist_set = set(_playlist)
+        
+        @staticmethod
+        def _Set_Recent(_recent: List[str]):
+            """Replaces recent wallpapers and rebuilds their lookup set"""
+            # Newest first: keep the first 20 (a bare maxlen would keep the oldest)
+            Collect.PlaylistData.recent_wallpapers = deque(itertools.islice(_recent, 20), maxlen=20)
+            Collect.PlaylistData._recent_set = set(Collect.PlaylistData.recent_wallpapers)
         
         @staticmethod
         def _Get_Random_Wallpaper() -> str:
             """Gets random wallpaper avoiding recent repeats"""
             _playlist = Alias.PlaylistState.current_playlist
-            _available = [w for w in _playlist if w not in Alias.PlaylistState.shuffle_history[-5:]]
+            if len(_playlist) == 1:
+                return _playlist[0]
             
-            if not _available:
-                _available = _playlist
-                Alias.PlaylistState.shuffle_history.clear()
+            _recent = set(itertools.islice(reversed(Alias.PlaylistState.shuffle_history), 5))
+            _length = len(_playlist)
+            _selected = None
             
-            _selected = random.choice(_available)
-            Alias.PlaylistState.shuffle_history.append(_selected)
+            # Rejection sampling: avoids copying the playlist in the common case
+            for _ in range(min(8, _length)):
+                _candidate = _playlist[random.randrange(_length)]
+                if _candidate not in _recent:
+                    _selected = _candidate
+                    break
             
-            # Keep shuffle history limited
-            if len(Alias.PlaylistState.shuffle_history) > 10:
-                Alias.PlaylistState.shuffle_history.pop(0)
+            if _selected is None:
+                _available = [w for w in _playlist if w not in _recent]
+                if not _available:
+                    _available = _playlist
+                    Alias.PlaylistState.shuffle_history.clear()
+                _selected = random.choice(_available)
+            # Shuffle history is a bounded deque (last 10 picks)
+            Alias.PlaylistState.shuffle_history.append(_selected)
             
-            Flow.PlaylistManager._Save_Settings()
+            Flow.PlaylistManager._Mark_Dirty()
             return _selected
         
         @staticmethod
@@ -369,33 +498,70 @@ class Flow:
             _playlist_length = len(Alias.PlaylistState.current_playlist)
             Alias.PlaylistState.current_index = (Alias.PlaylistState.current_index + 1) % _playlist_length
             
-            Flow.PlaylistManager._Save_Settings()
+            Flow.PlaylistManager._Mark_Dirty()
             return Alias.PlaylistState.current_playlist[Alias.PlaylistState.current_index]
         
+        @staticmethod
+        def _Mark_Dirty():
+            """
+            Marks playlist settings as modified.
+            Schedules a single coalesced save instead of writing immediately.
+            """
+            with Alias.PlaylistState._save_lock:
+                Alias.PlaylistState._dirty = True
+                if Alias.PlaylistState._flush_timer is not None:
+                    Alias.PlaylistState._flush_timer.cancel()
+                _timer = threading.Timer(Alias.PlaylistState.save_delay, Flow.PlaylistManager._Flush_Settings)
+                _timer.daemon = True
+                Alias.PlaylistState._flush_timer = _timer
+                _timer.start()
+        
+        @staticmethod
+        def _Flush_Settings():
+            """Writes pending playlist settings if any changes were marked"""
+            with Alias.PlaylistState._save_lock:
+                if Alias.PlaylistState._flush_timer is not None:
+                    Alias.PlaylistState._flush_timer.cancel()
+                    Alias.PlaylistState._flush_timer = None
+                if not Alias.PlaylistState._dirty:
+                    return
+            Flow.PlaylistManager._Save_Settings()
+        
         @staticmethod
         def _Save_Settings():
             """Saves current playlist settings to persistent storage"""
             try:
                 _settings_path = Bundle.PathResolver.get_settings_path()
-                _settings_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                _data = {
-                    'timer_interval': Alias.PlaylistState.timer_interval,
-                    'is_random': Alias.PlaylistState.is_random,
-                    'is_playing': Alias.PlaylistState.is_playing,
-                    'current_index': Alias.PlaylistState.current_index,
-                    'current_playlist': Alias.PlaylistState.current_playlist,
-                    'playlists': Collect.PlaylistData.saved_playlists,
-                    'recent': Collect.PlaylistData.recent_wallpapers
-                }
+                if not Alias.PlaylistState._settings_dir_ready:
+                    _settings_path.parent.mkdir(parents=True, exist_ok=True)
+                    Alias.PlaylistState._settings_dir_ready = True
                 
-                with open(_settings_path, 'w', encoding='utf-8') as f:
-                    json.dump(_data, f, indent=2, ensure_ascii=False)
+                with Alias.PlaylistState._save_lock:
+                    # Update the in-memory mirror in place (unknown keys are preserved)
+                    _data = Alias.PlaylistState._settings_cache
+                    for _key, _ in Flow.PlaylistManager._DEFAULT_SETTINGS:
+                        _data[_key] = getattr(Alias.PlaylistState, _key)
+                    _data['current_playlist'] = Alias.PlaylistState.current_playlist
+                    _data['playlists'] = Collect.PlaylistData.saved_playlists
+                    _data['recent'] = list(Collect.PlaylistData.recent_wallpapers)
+                    Alias.PlaylistState._dirty = False
+                    
+                    # Serialize once, write in a single call, then swap in atomically
+                    _payload = _dumps(_data)
+                    _tmp_path = _settings_path.with_suffix('.tmp')
+                    _fd = os.open(_tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        _view = memoryview(_payload)
+                        while _view:
+                            _view = _view[os.write(_fd, _view):]
+                    finally:
+                        os.close(_fd)
+                    os.replace(_tmp_path, _settings_path)
                 
-                logging.debug("Playlist settings saved")
+                _log.debug("Playlist settings saved")
                 
             except Exception as e:
-                logging.error(f"Failed to save playlist settings: {e}")
+                _log.error("Failed to save playlist settings: %s", e)
     
     class WallpaperController:
         """Dynamic wallpaper control and monitoring flow"""
@@ -409,7 +575,7 @@ class Flow:
             Alias.ControllerState.is_initialized = True
             Alias.ControllerState.control_presets = Bundle.PresetManager.load_control_presets()
             
-            logging.info("Wallpaper controller initialized")
+            _log.info("Wallpaper controller initialized")
         
         @staticmethod
         def Setup_Dynamic_Controls():
@@ -423,24 +589,59 @@ class Flow:
             Alias.ControllerState.is_muted = False
             Alias.ControllerState.mouse_disabled = False
             
-            logging.info("Dynamic controls setup completed")
+            _log.info("Dynamic controls setup completed")
         
         @staticmethod
         def Monitor_Process():
             """
             Monitors wallpaper engine process health.
-            Tracks process state and resource usage.
+            Exit watcher updates state on its own; this is a fallback check.
             """
-            if Alias.WallpaperState.current_process:
+            _process = Alias.WallpaperState.current_process
+            if _process:
                 try:
-                    _return_code = Alias.WallpaperState.current_process.poll()
-                    if _return_code is not None:
-                        # Process has terminated
-                        Alias.WallpaperState.is_running = False
-                        Alias.WallpaperState.current_process = None
-                        logging.warning(f"Wallpaper process terminated with code: {_return_code}")
+                    Flow.WallpaperController._Handle_Process_Exit(_process)
                 except Exception as e:
-                    logging.error(f"Process monitoring error: {e}")
+                    _log.error("Process monitoring error: %s", e)
+        
+        @staticmethod
+        def _Start_Exit_Watcher(_process):
+            """
+            Starts a background thread that wakes up only when the process exits.
+            Uses a pidfd, so nothing is polled while the wallpaper is running.
+            """
+            try:
+                _pidfd = os.pidfd_open(_process.pid)
+            except (AttributeError, OSError):
+                return  # No pidfd support; Monitor_Process polling remains
+            
+            threading.Thread(
+                target=Flow.WallpaperController._Watch_Process_Exit,
+                args=(_process, _pidfd),
+                name="wallpaper-exit-watcher",
+                daemon=True
+            ).start()
+        
+        @staticmethod
+        def _Watch_Process_Exit(_process, _pidfd: int):
+            """Blocks until the pidfd becomes readable (process exited)"""
+            try:
+                select.select([_pidfd], [], [])
+            finally:
+                os.close(_pidfd)
+            Flow.WallpaperController._Handle_Process_Exit(_process)
+        
+        @staticmethod
+        def _Handle_Process_Exit(_process):
+            """Reaps process and clears running state if it has terminated"""
+            _return_code = _process.poll()
+            if _return_code is None:
+                return
+            if Alias.WallpaperState.current_process is _process:
+                # Process has terminated
+                Alias.WallpaperState.is_running = False
+                Alias.WallpaperState.current_process = None
+                _log.warning("Wallpaper process terminated with code: %s", _return_code)
         
         @staticmethod
         def Set_Volume(_volume: int) -> bool:
@@ -455,10 +656,10 @@ class Flow:
                 # Implementation would send volume control signal
                 # This is a placeholder for actual volume control
                 Alias.ControllerState.current_volume = _volume
-                logging.info(f"Volume set to: {_volume}%")
+                _log.info("Volume set to: %s%%", _volume)
                 return True
             except Exception as e:
-                logging.error(f"Failed to set volume: {e}")
+                _log.error("Failed to set volume: %s", e)
                 return False
         
         @staticmethod
@@ -474,10 +675,10 @@ class Flow:
                 # Implementation would send FPS control signal
                 # This is a placeholder for actual FPS control
                 Alias.ControllerState.current_fps = _fps
-                logging.info(f"FPS set to: {_fps}")
+                _log.info("FPS set to: %s", _fps)
                 return True
             except Exception as e:
-                logging.error(f"Failed to set FPS: {e}")
+                _log.error("Failed to set FPS: %s", e)
                 return False
         
         @staticmethod
@@ -492,10 +693,10 @@ class Flow:
             try:
                 Alias.ControllerState.is_muted = not Alias.ControllerState.is_muted
                 _state = "muted" if Alias.ControllerState.is_muted else "unmuted"
-                logging.info(f"Audio {_state}")
+                _log.info("Audio %s", _state)
                 return True
             except Exception as e:
-                logging.error(f"Failed to toggle mute: {e}")
+                _log.error("Failed to toggle mute: %s", e)
                 return False
         
         @staticmethod
@@ -504,29 +705,26 @@ class Flow:
             Applies predefined control preset.
             Sets multiple parameters according to preset configuration.
             """
-            if _preset_name not in Alias.ControllerState.control_presets:
-                logging.error(f"Unknown preset: {_preset_name}")
+            _preset = Alias.ControllerState.control_presets.get(_preset_name)
+            if _preset is None:
+                _log.error("Unknown preset: %s", _preset_name)
+                return False
+            
+            if not Flow.WallpaperController._Is_Wallpaper_Running():
                 return False
             
             try:
-                _preset = Alias.ControllerState.control_presets[_preset_name]
+                # Apply all preset settings in one state update
+                _state = Alias.ControllerState
+                _state.current_volume = _preset.get('volume', _state.current_volume)
+                _state.current_fps = _preset.get('fps', _state.current_fps)
+                _state.is_muted = _preset.get('muted', _state.is_muted)
                 
-                # Apply preset settings
-                if 'volume' in _preset:
-                    Flow.WallpaperController.Set_Volume(_preset['volume'])
-                
-                if 'fps' in _preset:
-                    Flow.WallpaperController.Set_FPS(_preset['fps'])
-                
-                if 'muted' in _preset:
-                    if _preset['muted'] != Alias.ControllerState.is_muted:
-                        Flow.WallpaperController.Toggle_Mute()
-                
-                logging.info(f"Preset applied: {_preset_name}")
+                _log.info("Preset applied: %s", _preset_name)
                 return True
                 
             except Exception as e:
-                logging.error(f"Failed to apply preset {_preset_name}: {e}")
+                _log.error("Failed to apply preset %s: %s", _preset_name, e)
                 return False
         
         @staticmethod
@@ -548,10 +746,10 @@ class Bundle:
         @staticmethod
         def get_wallpaper_path(_wallpaper_id: str) -> Path:
             """Resolves wallpaper ID to full filesystem path"""
-            from utils import STEAM_WORKSHOP_PATH
-            return Path(STEAM_WORKSHOP_PATH) / _wallpaper_id
+            return _WORKSHOP / _wallpaper_id
         
         @staticmethod
+        @functools.cache
         def get_settings_path() -> Path:
             """Gets playlist settings file path"""
             return Path.home() / ".config" / "wallpaper_engine" / "playlist_settings.json"
@@ -562,30 +760,165 @@ class Bundle:
         @staticmethod
         def get_current_timestamp() -> float:
             """Gets current timestamp"""
-            import time
             return time.time()
     
     class PresetManager:
         """Control preset management"""
         
         @staticmethod
-        def load_control_presets() -> Dict[str, Dict[str, Any]]:
-            """Loads predefined control presets"""
-            return {
-                "performance": {"volume": 30, "fps": 30, "muted": False},
-                "quality": {"volume": 70, "fps": 60, "muted": False},
-                "silent": {"volume": 0, "fps": 30, "muted": True},
-                "gaming": {"volume": 20, "fps": 144, "muted": False}
-            }
+        @functools.lru_cache(maxsize=None)
+        def load_control_presets() -> Mapping[str, Mapping[str, Any]]:
+            """Loads predefined control presets (built once, read-only)"""
+            return MappingProxyType({
+                "performance": MappingProxyType({"volume": 30, "fps": 30, "muted": False}),
+                "quality": MappingProxyType({"volume": 70, "fps": 60, "muted": False}),
+                "silent": MappingProxyType({"volume": 0, "fps": 30, "muted": True}),
+                "gaming": MappingProxyType({"volume": 20, "fps": 144, "muted": False})
+            })
+    
+    class DetachedProcess:
+        """
+        Minimal Popen-like handle for a process started with posix_spawn.
+        Exposes pid, returncode, stdout/stderr pipes, poll() and wait().
+        """
+        
+        def __init__(self, _pid: int, _stdout=None, _stderr=None):
+            self.pid = _pid
+            self.returncode: Optional[int] = None
+            self.stdout = _stdout
+            self.stderr = _stderr
+            # Serializes waitpid across threads, like Popen._waitpid_lock
+            self._waitpid_lock = threading.Lock()
+        
+        def poll(self) -> Optional[int]:
+            """Returns exit code if the process has finished, otherwise None"""
+            if self.returncode is None:
+                self._reap(os.WNOHANG)
+            return self.returncode
+        
+        def wait(self) -> int:
+            """Blocks until the process exits and returns its exit code"""
+            if self.returncode is None:
+                self._reap(0)
+            return self.returncode
+        
+        def _reap(self, _options: int):
+            # Non-blocking callers back off while another thread is reaping
+            if not self._waitpid_lock.acquire(not _options & os.WNOHANG):
+                return
+            try:
+                # The other thread may have stored the real exit code meanwhile
+                if self.returncode is not None:
+                    return
+                try:
+                    _pid, _status = os.waitpid(self.pid, _options)
+                except ChildProcessError:
+                    # Reaped outside this handle; exit status is unknown
+                    self.returncode = 0
+                    return
+                if _pid:
+                    self.returncode = os.waitstatus_to_exitcode(_status)
+            finally:
+                self._waitpid_lock.release()
     
     class ProcessManager:
         """Process management utilities"""
         
+        @staticmethod
+        def spawn_detached(_cmd: List[str], _capture_output: bool = False):
+            """
+            Starts command in a new session without forking the caller.
+            Uses posix_spawn (clone+exec) where available, Popen otherwise.
+            Output is discarded unless capture_output is set, in which case
+            stderr is drained into the log by a background thread.
+            """
+            if not hasattr(os, 'posix_spawnp'):
+                _process = subprocess.Popen(
+                    _cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE if _capture_output else subprocess.DEVNULL,
+                    start_new_session=True  # Detached process
+                )
+                if _capture_output:
+                    Bundle.ProcessManager._Start_Drain(_process.stderr)
+                return _process
+            
+            # Resolved path skips the PATH search inside posix_spawnp
+            _executable = Bundle.ProcessManager.resolve_executable(_cmd[0])
+            _spawn = os.posix_spawn if _executable else os.posix_spawnp
+            
+            _file_actions = [(os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0)]
+            _err_read = _err_write = None
+            if _capture_output:
+                _err_read, _err_write = os.pipe()
+                _file_actions.append((os.POSIX_SPAWN_DUP2, _err_write, 2))
+            else:
+                _file_actions.append((os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0))
+            
+            try:
+                _pid = _spawn(
+                    _executable or _cmd[0], _cmd, os.environ,
+                    file_actions=_file_actions,
+                    setsid=True  # Detached process
+                )
+            except BaseException:
+                if _err_read is not None:
+                    os.close(_err_read)
+                raise
+            finally:
+                if _err_write is not None:
+                    os.close(_err_write)
+            
+            _stderr = None
+            if _err_read is not None:
+                _stderr = open(_err_read, 'rb')
+                Bundle.ProcessManager._Start_Drain(_stderr)
+            return Bundle.DetachedProcess(_pid, None, _stderr)
+        
+        @staticmethod
+        def _Start_Drain(_stream):
+            """Forwards process output to the log line by line until EOF"""
+            def _drain():
+                with _stream:
+                    for _line in _stream:
+                        _log.warning("wallpaper-engine: %s", _line.decode('utf-8', 'replace').rstrip())
+            
+            threading.Thread(target=_drain, name="wallpaper-output-drain", daemon=True).start()
+        
+        @staticmethod
+        def resolve_executable(_name) -> Optional[str]:
+            """Resolves executable name (str or Path) to an absolute path, caching hits"""
+            _name = os.fspath(_name)
+            if os.sep in _name:
+                return _name
+            _path = Collect.ProcessData.resolved_executables.get(_name)
+            if _path is None:
+                _path = shutil.which(_name)
+                if _path:
+                    Collect.ProcessData.resolved_executables[_name] = _path
+            return _path
+        
+        @staticmethod
+        def prewarm_executable(_name: str):
+            """Asks the kernel to read the executable into the page cache"""
+            try:
+                _path = Bundle.ProcessManager.resolve_executable(_name)
+                if _path and hasattr(os, 'posix_fadvise'):
+                    _fd = os.open(_path, os.O_RDONLY)
+                    try:
+                        os.posix_fadvise(_fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(_fd)
+                    _log.debug("Executable prewarmed: %s", _path)
+            except OSError as e:
+                _log.debug("Executable prewarm skipped: %s", e)
+        
         @staticmethod
         def is_process_running(_pid: int) -> bool:
             """Checks if process with given PID is running"""
+            if psutil is None:
+                return False
             try:
-                import psutil
                 return psutil.pid_exists(_pid)
             except:
                 return False
@@ -593,8 +926,9 @@ class Bundle:
         @staticmethod
         def get_process_info(_pid: int) -> Optional[Dict[str, Any]]:
             """Gets process information"""
+            if psutil is None:
+                return None
             try:
-                import psutil
                 _process = psutil.Process(_pid)
                 return {
                     "pid": _pid,
@@ -606,41 +940,70 @@ class Bundle:
                 return None
 
 
+@dataclass(slots=True)
+class _WallpaperState:
+    """Current wallpaper engine state"""
+    current_wallpaper: Optional[str] = None
+    is_running: bool = False
+    current_process: Optional[Any] = None  # subprocess.Popen or Bundle.DetachedProcess
+    process_pid: Optional[int] = None
+    validated_wallpaper: Optional[str] = None
+    prepared_command: Optional[List[str]] = None
+    command_kwargs: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    last_applied_time: Optional[float] = None
+    _spawn_lock: Any = field(default_factory=threading.Lock, repr=False)
+    _spawn_generation: int = 0  # Incremented on every successful launch
+
+
+@dataclass(slots=True)
+class _PlaylistState:
+    """Playlist manager state"""
+    current_playlist: List[str] = field(default_factory=list)
+    _current_playlist_set: Set[str] = field(default_factory=set)  # Membership index for current_playlist
+    timer_interval: int = 30
+    is_random: bool = False
+    is_playing: bool = False
+    current_index: int = 0
+    last_wallpaper: Optional[str] = None
+    shuffle_history: Deque[str] = field(default_factory=lambda: deque(maxlen=10))
+    save_delay: float = 0.5  # Seconds to coalesce playlist saves
+    _settings_cache: Dict[str, Any] = field(default_factory=dict)
+    _dirty: bool = False
+    _flush_timer: Optional[threading.Timer] = None
+    _save_lock: Any = field(default_factory=threading.RLock, repr=False)
+    _settings_dir_ready: bool = False
+
+
+@dataclass(slots=True)
+class _ControllerState:
+    """Wallpaper controller state"""
+    is_initialized: bool = False
+    current_volume: int = 50
+    current_fps: int = 60
+    is_muted: bool = False
+    mouse_disabled: bool = False
+    control_presets: Mapping[str, Mapping[str, Any]] = field(default_factory=lambda: MappingProxyType({}))
+
+
 class Alias:
     """
     Core state management and shared variables.
     Organized by functional area for clarity.
+    Each state is a single slotted dataclass instance.
     """
     
-    class WallpaperState:
-        """Current wallpaper engine state"""
-        current_wallpaper: Optional[str] = None
-        is_running: bool = False
-        current_process: Optional[subprocess.Popen] = None
-        process_pid: Optional[int] = None
-        validated_wallpaper: Optional[str] = None
-        prepared_command: Optional[List[str]] = None
-        command_kwargs: Dict[str, Any] = {}
-        last_applied_time: Optional[float] = None
-    
-    class PlaylistState:
-        """Playlist manager state"""
-        current_playlist: List[str] = []
-        timer_interval: int = 30
-        is_random: bool = False
-        is_playing: bool = False
-        current_index: int = 0
-        last_wallpaper: Optional[str] = None
-        shuffle_history: List[str] = []
-    
-    class ControllerState:
-        """Wallpaper controller state"""
-        is_initialized: bool = False
-        current_volume: int = 50
-        current_fps: int = 60
-        is_muted: bool = False
-        mouse_disabled: bool = False
-        control_presets: Dict[str, Dict[str, Any]] = {}
+    WallpaperState = _WallpaperState()
+    PlaylistState = _PlaylistState()
+    ControllerState = _ControllerState()
+
+
+@dataclass(slots=True)
+class ExecutionRecord:
+    """Single wallpaper execution entry (kwargs is read-only; dict() it to serialize)"""
+    wallpaper_id: str
+    timestamp: float
+    command: List[str]
+    kwargs: Mapping[str, Any]
 
 
 class Collect:
@@ -651,17 +1014,19 @@ class Collect:
     
     class ExecutionHistory:
         """Wallpaper execution history"""
-        recent_executions: List[Dict[str, Any]] = []
+        recent_executions: Deque[ExecutionRecord] = deque(maxlen=10)
         error_log: List[Dict[str, Any]] = []
     
     class PlaylistData:
         """Playlist and user data"""
         saved_playlists: Dict[str, List[str]] = {}
-        recent_wallpapers: List[str] = []
+        recent_wallpapers: Deque[str] = deque(maxlen=20)
+        _recent_set: Set[str] = set()  # Membership index for recent_wallpapers
         playlist_statistics: Dict[str, int] = {}
     
     class ProcessData:
         """Process monitoring data"""
         process_history: List[Dict[str, Any]] = []
         performance_metrics: Dict[str, List[float]] = {}
-        resource_usage: Dict[str, float] = {}
\ No newline at end of file
+        resource_usage: Dict[str, float] = {}
+        resolved_executables: Dict[str, str] = {}
\ No newline at end of file
@@ -1,10 +1,12 @@
 """
 Sistem ile ilgili yardımcı fonksiyonlar
 """
+import os
+import signal
 import subprocess
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 
 from utils.constants import STEAM_WORKSHOP_PATH, SUPPORTED_IMAGE_FORMATS
 
@@ -148,14 +150,20 @@ def get_screens() -> List[str]:
         return ["eDP-1"]
 
 
-def kill_existing_wallpapers() -> bool:
+def kill_existing_wallpapers(exclude_pids: Optional[Iterable[int]] = None) -> bool:
     """
     Çalışan wallpaper engine süreçlerini sonlandırır.
     
+    Args:
+        exclude_pids: Sonlandırılmayacak PID'ler (ör. yeni başlatılan süreç)
+    
     Returns:
         bool: İşlem başarılı ise True
     """
     try:
+        if exclude_pids:
+            return _kill_wallpapers_except(set(exclude_pids))
+        
         result = subprocess.run(
             ["pkill", "-f", "linux-wallpaperengine"],
             capture_output=True,
@@ -177,6 +185,34 @@ def kill_existing_wallpapers() -> bool:
         return False
 
 
+def _kill_wallpapers_except(exclude_pids: set) -> bool:
+    """pkill ile aynı eşleşmeyi pgrep ile bulur, hariç tutulanlar dışındakilere SIGTERM gönderir."""
+    result = subprocess.run(
+        ["pgrep", "-f", "linux-wallpaperengine"],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    
+    killed = 0
+    for line in result.stdout.split():
+        pid = int(line)
+        if pid in exclude_pids or pid == os.getpid():
+            continue
+        try:
+            os.kill(pid, signal.SIGTERM)
+            killed += 1
+        except ProcessLookupError:
+            pass
+    
+    if killed:
+        logger.info("Mevcut wallpaper süreçleri sonlandırıldı")
+    else:
+        logger.info("Sonlandırılacak wallpaper süreci bulunamadı")
+    
+    return True
+
+
 def validate_wallpaper_path(wallpaper_id: str) -> bool:
     """
     Wallpaper ID'sinin geçerli olup olmadığını kontrol eder.